@@ -0,0 +1,92 @@
+"""Pipeline analisis satu input: parsing, klasifikasi, sampling grafik, dan turunan.
+
+`analyze` dijalankan di proses pekerja (lihat sandbox.py), sehingga input
+yang berat tidak pernah menahan thread Streamlit. Hasilnya berupa tuple
+yang bisa di-pickle (ekspresi SymPy + array NumPy). Di proses utama hasil
+disimpan di `analysis_cache` per bentuk kanonik ekspresi, jadi `4 + x**2`
+setelah `x**2 + 4` tidak dianalisis ulang (cukup job parse kecil). Cache
+fungsi dan klasifikasi hidup di proses pekerja; statistiknya ikut dikirim
+bersama setiap hasil agar bisa ditampilkan.
+"""
+
+import time
+from collections import namedtuple
+
+from calculus import derivative_analysis
+from numeric import LRUCache, adaptive_sample, function_cache, robust_ylim
+from parity import canonical_key, parity_cache
+
+PLOT_RANGE = (-5, 5)
+CACHE_SIZE = 512
+
+Analysis = namedtuple("Analysis", [
+    "f_expr", "result_type", "f_neg_x", "neg_f_x",
+    "segments", "y_limits", "evaluations", "sample_error",
+    "derivatives", "derivative_error", "timings", "key", "cache_stats",
+])
+
+
+def analyze(text):
+    """Parse, klasifikasi, sampling, dan turunan `text`; mengembalikan `Analysis` (waktu per tahap dalam ms)."""
+    timings = {}
+    start = time.perf_counter()
+    f_expr = parity_cache.parse(text)
+    timings["parse"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    result_type, f_neg_x, neg_f_x = parity_cache.classify(f_expr)
+    timings["klasifikasi"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    try:
+        # Sampling adaptif: titik dirapatkan hanya di bagian melengkung, garis diputus di kutub/loncatan
+        segments, evaluations = adaptive_sample(function_cache.get(f_expr), *PLOT_RANGE)
+        y_limits, sample_error = robust_ylim(segments), None
+    except Exception as e:
+        # Klasifikasi tetap ditampilkan walaupun grafik gagal (mis. ada simbol selain x)
+        segments, y_limits, evaluations, sample_error = [], None, 0, str(e)
+    timings["sampling"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    try:
+        derivatives, derivative_error = derivative_analysis(f_expr, result_type, PLOT_RANGE), None
+    except Exception as e:
+        # Mis. floor(x): turunannya tidak punya bentuk eksplisit
+        derivatives, derivative_error = None, str(e)
+    timings["turunan"] = (time.perf_counter() - start) * 1000
+
+    # Statistik cache milik pekerja yang menjalankan job ini
+    cache_stats = {"fungsi": function_cache.stats(), "klasifikasi": parity_cache.stats()}
+    return Analysis(f_expr, result_type, f_neg_x, neg_f_x, segments, y_limits, evaluations,
+                    sample_error, derivatives, derivative_error, timings, canonical_key(f_expr), cache_stats)
+
+
+def canonical_text(text):
+    """Kunci kanonik `text` (parse + srepr) untuk mencari `analysis_cache` tanpa analisis penuh."""
+    return canonical_key(parity_cache.parse(text))
+
+
+def warm_up():
+    """Menjalankan pipeline sekali agar impor malas (lambdify, printer) terjadi sebelum job pertama."""
+    analyze("x**3 - x")
+
+
+# --- Cache Hasil ---
+
+class AnalysisCache(LRUCache):
+    """`Analysis` per kunci kanonik, ditambah alias teks input (spasi di tepi diabaikan) -> kunci."""
+
+    def __init__(self, maxsize=CACHE_SIZE):
+        super().__init__(maxsize)
+        self._aliases = LRUCache(maxsize)
+
+    def key_for(self, text):
+        """Kunci kanonik teks yang pernah dilihat, atau None."""
+        return self._aliases.get(text.strip())
+
+    def alias(self, text, key):
+        self._aliases.put(text.strip(), key)
+
+
+# Hanya dipakai di proses aplikasi; pekerja selalu menghitung ulang
+analysis_cache = AnalysisCache()
@@ -1,7 +1,12 @@
+import time
+
 import streamlit as st
 import matplotlib.pyplot as plt
-import numpy as np
-from sympy import symbols, sympify, latex, diff
+from sympy import symbols, latex
+
+from analysis import PLOT_RANGE, analysis_cache, analyze, canonical_text, warm_up
+from parity import EVEN, ODD
+from sandbox import DEADLINE, JobTimeout, WorkerCrashed, WorkerPool, default_pool_size
 
 # --- Konfigurasi Gaya & Header ---
 st.set_page_config(
@@ -14,6 +19,8 @@ COLOR_PRIMARY = "#FF4500"  # Orange Red
 COLOR_EVEN = "#1E90FF"     # Dodger Blue
 COLOR_ODD = "#32CD32"      # Lime Green
 COLOR_TEXT = "#333333"
+COLOR_CRITICAL = "#8A2BE2" # Blue Violet
+MAX_POINTS_SHOWN = 20      # Baris tabel titik kritis/belok yang ditampilkan
 
 st.markdown(f"""
     <style>
@@ -32,53 +39,76 @@ x = symbols('x')
 
 # --- Fungsi Inti ---
 
-def classify_function(f_expr, x):
-    """Mengklasifikasikan fungsi berdasarkan definisi aljabar."""
+@st.cache_resource
+def get_pool():
+    """Satu pool pekerja per proses server, dipakai semua sesi (modul analisis sudah diimpor di forkserver)."""
+    return WorkerPool(default_pool_size(), preload=["analysis"], warmup=warm_up)
+
+def cancel_analysis():
+    st.session_state.run_analysis = False
+
+def wait_for(job, progress, start):
+    """Menunggu job sambil memperbarui progress (waktu dihitung sejak `start`); job dihentikan jika script berhenti."""
     try:
-        f_neg_x = f_expr.subs(x, -x)
-        neg_f_x = -f_expr
-
-        is_even = f_neg_x.equals(f_expr)
-        is_odd = f_neg_x.equals(neg_f_x)
-
-        if is_even:
-            return "Genap (Even)", f_neg_x, neg_f_x
-        elif is_odd:
-            return "Ganjil (Odd)", f_neg_x, neg_f_x
-        else:
-            return "Bukan Ganjil dan Bukan Genap (Neither)", f_neg_x, neg_f_x
-    except Exception as e:
-        return f"Error: {e}", None, None
+        # Pembaruan progress juga memberi Streamlit kesempatan menghentikan script saat ada rerun
+        return job.wait(on_tick=lambda _: progress.progress(
+            min((time.monotonic() - start) / DEADLINE, 1.0),
+            text=f"Menganalisis fungsi... {time.monotonic() - start:.1f} / {DEADLINE:.0f} detik"))
+    finally:
+        job.cancel() # Rerun/pembatalan di tengah jalan: proses pekerja dihentikan dan diganti
 
-def plot_function(f_expr, result_type):
-    """Membuat plot interaktif menggunakan Matplotlib."""
+def run_analysis(text):
+    """Analisis `text` di proses pekerja (dengan batas waktu & memori); hasil di-cache per bentuk kanonik."""
+    key = analysis_cache.key_for(text)
+    result = analysis_cache.get(key) if key is not None else None
+    if result is not None:
+        return result
+    pool = get_pool()
+    progress = st.progress(0.0, text="Menganalisis fungsi...")
+    st.button("Batalkan analisis", on_click=cancel_analysis)
+    start = time.monotonic()
     try:
-        # Konversi ekspresi sympy ke fungsi numpy yang dapat diplot
-        f_numpy = lambda val: np.array([f_expr.subs(x, float(i)) for i in val], dtype=float)
-        
-        # Batas plot
-        x_vals = np.linspace(-5, 5, 400)
-        y_vals = f_numpy(x_vals)
-        
-        # Ambil hanya nilai yang valid (hindari error log/sqrt)
-        valid_indices = np.isfinite(y_vals)
-        x_vals = x_vals[valid_indices]
-        y_vals = y_vals[valid_indices]
+        if key is None:
+            # Teks baru: cukup parse di pekerja dulu, mungkin bentuk kanoniknya sudah dianalisis
+            key = wait_for(pool.submit(canonical_text, text, deadline=DEADLINE), progress, start)
+            analysis_cache.alias(text, key)
+            result = analysis_cache.get(key)
+        if result is None:
+            result = wait_for(pool.submit(analyze, text, deadline=DEADLINE), progress, start)
+            analysis_cache.put(key, result)
+    finally:
+        progress.empty()
+    return result
 
+def plot_function(f_expr, result_type, segments, y_limits, derivatives=None):
+    """Membuat plot interaktif menggunakan Matplotlib."""
+    try:
         fig, ax = plt.subplots(figsize=(8, 6))
         
-        # Plot fungsi utama
-        ax.plot(x_vals, y_vals, label=f'$f(x) = {latex(f_expr)}$', color=COLOR_PRIMARY, linewidth=2)
+        # Plot fungsi utama: satu garis per segmen kontinu (tidak ada garis tegak di kutub/loncatan)
+        for i, (x_vals, y_vals) in enumerate(segments):
+            ax.plot(x_vals, y_vals, label=f'$f(x) = {latex(f_expr)}$' if i == 0 else None,
+                    color=COLOR_PRIMARY, linewidth=2)
+        # Batas y dari kuantil, bukan min/max (nilai di dekat kutub bisa mencapai 1e16)
+        ax.set_ylim(*y_limits)
+        if derivatives:
+            if derivatives.critical:
+                crit_x, crit_y, _ = zip(*derivatives.critical)
+                ax.plot(crit_x, crit_y, 'o', color=COLOR_CRITICAL, label="Titik kritis ($f'(x) = 0$)")
+            if derivatives.inflection:
+                infl_x, infl_y = zip(*derivatives.inflection)
+                ax.plot(infl_x, infl_y, 'x', color=COLOR_CRITICAL, markersize=8, label="Titik belok")
+        text_y = y_limits[1] - 0.1 * (y_limits[1] - y_limits[0])
         
         # Penjelasan Simetri
-        if result_type == "Genap (Even)":
+        if result_type == EVEN:
             ax.axvline(0, color=COLOR_EVEN, linestyle='--', label='Simetri terhadap Sumbu Y')
-            ax.text(0.1, ax.get_ylim()[1] * 0.9, "Simetri Y", color=COLOR_EVEN, fontsize=10)
-        elif result_type == "Ganjil (Odd)":
+            ax.text(0.1, text_y, "Simetri Y", color=COLOR_EVEN, fontsize=10)
+        elif result_type == ODD:
             ax.axvline(0, color=COLOR_ODD, linestyle='--', label='Simetri terhadap Titik Asal')
             ax.axhline(0, color=COLOR_ODD, linestyle='--')
             ax.plot(0, 0, 'o', color=COLOR_ODD, label='Titik Asal')
-            ax.text(0.1, ax.get_ylim()[1] * 0.9, "Simetri Asal", color=COLOR_ODD, fontsize=10)
+            ax.text(0.1, text_y, "Simetri Asal", color=COLOR_ODD, fontsize=10)
         
         # Pengaturan Grid dan Axis
         ax.axhline(0, color='gray', linewidth=0.5)
@@ -88,8 +118,7 @@ def plot_function(f_expr, result_type):
         ax.set_ylabel("f(x)")
         ax.set_title(f"Grafik Fungsi: {result_type}", fontsize=14)
         ax.legend()
-        ax.set_ylim(np.nanmin(y_vals) - 1, np.nanmax(y_vals) + 1)
-        ax.set_xlim(-5, 5)
+        ax.set_xlim(*PLOT_RANGE)
         
         return fig
         
@@ -138,13 +167,17 @@ with col_input:
 with col_result:
     if st.session_state.get('run_analysis', False) and f_input:
         try:
-            # 1. Parsing Fungsi
-            f_expr = sympify(f_input)
-            
-            # 2. Klasifikasi Aljabar
-            result_type, f_neg_x, neg_f_x = classify_function(f_expr, x)
+            # 1-2. Parsing, klasifikasi aljabar, sampling grafik, dan turunan di proses pekerja
+            analysis = run_analysis(f_input)
+            f_expr, result_type, f_neg_x, neg_f_x = analysis[:4]
             
             st.header("2. Hasil Analisis")
+            hits, misses, size = analysis_cache.stats()
+            st.caption(" · ".join(f"{name} {ms:.1f} ms" for name, ms in analysis.timings.items())
+                       + f" · cache analisis: {hits} hit, {misses} miss, {size} fungsi")
+            # Cache fungsi terkompilasi & klasifikasi hidup di pekerja; angkanya dari pekerja yang menganalisis
+            st.caption(" · ".join(f"cache {name} (pekerja): {h} hit, {m} miss, {n} entri"
+                                  for name, (h, m, n) in analysis.cache_stats.items()))
             
             # Tampilkan Klasifikasi
             if result_type.startswith("Genap"):
@@ -181,7 +214,12 @@ with col_result:
             
             # 4. Visualisasi Grafik
             st.subheader("4. Visualisasi Grafik & Simetri")
-            fig = plot_function(f_expr, result_type)
+            if analysis.sample_error:
+                st.error(f"Gagal memplot fungsi. Pastikan fungsi valid. Error: {analysis.sample_error}")
+                fig = None
+            else:
+                fig = plot_function(f_expr, result_type, analysis.segments, analysis.y_limits, analysis.derivatives)
+                st.caption(f"Grafik dari {analysis.evaluations} evaluasi f(x) (sampling adaptif).")
             if fig:
                 st.pyplot(fig)
             
@@ -189,8 +227,57 @@ with col_result:
             * **Fungsi Genap:** Grafik simetri terhadap sumbu Y (seperti cermin).
             * **Fungsi Ganjil:** Grafik simetri terhadap titik asal (diputar 180° di sekitar titik (0,0)).
             """)
+
+            st.markdown("---")
+
+            # 5. Turunan & Titik Kritis
+            st.subheader("5. Turunan & Titik Kritis")
+            derivatives = analysis.derivatives
+            if analysis.derivative_error:
+                st.warning(f"Turunan tidak dapat dianalisis: {analysis.derivative_error}")
+            else:
+                col_d1, col_d2 = st.columns(2)
+                with col_d1:
+                    st.latex(f"f'(x) = {latex(derivatives.f1)}")
+                with col_d2:
+                    st.latex(f"f''(x) = {latex(derivatives.f2)}")
+
+                col_crit, col_infl = st.columns(2)
+                with col_crit:
+                    st.markdown(f"#### Titik Kritis di [{PLOT_RANGE[0]}, {PLOT_RANGE[1]}]")
+                    if derivatives.critical:
+                        st.table([{"x": f"{px:.4f}", "f(x)": f"{py:.4f}", "Jenis": kind}
+                                  for px, py, kind in derivatives.critical[:MAX_POINTS_SHOWN]])
+                    else:
+                        st.write("Tidak ada titik dengan $f'(x) = 0$.")
+                with col_infl:
+                    st.markdown(f"#### Titik Belok di [{PLOT_RANGE[0]}, {PLOT_RANGE[1]}]")
+                    if derivatives.inflection:
+                        st.table([{"x": f"{px:.4f}", "f(x)": f"{py:.4f}"}
+                                  for px, py in derivatives.inflection[:MAX_POINTS_SHOWN]])
+                    else:
+                        st.write("Tidak ada titik tempat $f''(x)$ berganti tanda.")
+                if max(len(derivatives.critical), len(derivatives.inflection)) > MAX_POINTS_SHOWN:
+                    st.caption(f"Hanya {MAX_POINTS_SHOWN} titik pertama yang ditampilkan "
+                               f"({len(derivatives.critical)} titik kritis, {len(derivatives.inflection)} titik belok).")
+
+                # Turunan fungsi genap adalah fungsi ganjil, dan sebaliknya
+                if derivatives.consistency:
+                    st.markdown("#### Konsistensi dengan Paritas:")
+                    for description, ok in derivatives.consistency:
+                        if ok:
+                            st.success(f"✅ {description}")
+                        else:
+                            st.warning(f"⚠️ Tidak sesuai harapan: {description}")
+                else:
+                    st.info("Fungsi bukan genap/ganjil, jadi tidak ada simetri turunan yang diharapkan.")
             
             
+        except JobTimeout as e:
+            st.error(f"⏱️ Analisis dihentikan: {e}. Fungsi ini terlalu berat untuk dianalisis; "
+                     "coba sederhanakan (misalnya pangkat yang lebih kecil).")
+        except WorkerCrashed as e:
+            st.error(f"Analisis dihentikan: {e}. Coba fungsi yang lebih sederhana.")
         except Exception as e:
             st.error(f"Input fungsi tidak valid. Pastikan Anda menggunakan sintaks yang benar (misalnya: x**2, sin(x)). Error: {e}")
             
@@ -0,0 +1,140 @@
+"""Klasifikasi genap/ganjil massal dari file, satu fungsi per baris.
+
+Setiap ekspresi diklasifikasikan dengan `classify_function` di pool pekerja
+terisolasi (sandbox.py): beberapa ekspresi diproses paralel, masing-masing
+dengan batas waktu, dan ekspresi yang macet hanya menghentikan pekerjanya.
+Hasil ditulis per baris begitu selesai sebagai JSON lines; ringkasan
+throughput dan ekspresi paling lambat ditulis ke stderr.
+
+    python batch.py lembar_kerja.txt -o hasil.jsonl --workers 4 --timeout 5
+
+Baris kosong dan baris yang diawali `#` dilewati.
+"""
+
+import argparse
+import heapq
+import json
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from analysis import warm_up
+from parity import classify_text
+from sandbox import DEADLINE, JobFailed, JobTimeout, WorkerCrashed, WorkerPool
+
+
+def read_expressions(lines):
+    """(nomor baris, teks) untuk setiap baris berisi ekspresi, dibaca bertahap."""
+    for number, line in enumerate(lines, 1):
+        text = line.strip()
+        if text and not text.startswith("#"):
+            yield number, text
+
+
+def classify_one(pool, number, text, timeout):
+    """Mengklasifikasikan satu ekspresi di pool; selalu mengembalikan satu record (juga saat gagal).
+
+    `ms` diukur sejak job diterima pekerja, jadi waktu antre menunggu pekerja
+    bebas tidak ikut dihitung.
+    """
+    record = {"line": number, "f": text}
+    job, start = None, time.perf_counter()
+    try:
+        job = pool.submit(classify_text, text, deadline=timeout)
+        result_type, f_neg_x, neg_f_x = job.wait()
+        if result_type.startswith("Error"):
+            record.update(status="error", error=result_type)
+        else:
+            record.update(status="ok", **{"class": result_type, "f(-x)": f_neg_x, "-f(x)": neg_f_x})
+    except JobTimeout as e:
+        record.update(status="timeout", error=str(e))
+    except WorkerCrashed as e:
+        record.update(status="crash", error=str(e))
+    except JobFailed as e:
+        record.update(status="error", error=str(e))
+    seconds = job.elapsed() if job else time.perf_counter() - start
+    record["ms"] = round(seconds * 1000, 2)
+    return record
+
+
+def run_batch(expressions, out, workers, timeout=DEADLINE, slowest=5):
+    """Memproses `expressions` secara paralel dan menulis JSON lines ke `out`; mengembalikan `BatchSummary`."""
+    pool = WorkerPool(workers, preload=["analysis"], warmup=warm_up)
+    summary = BatchSummary(slowest)
+    # Antrean dibatasi agar file besar tidak dibaca seluruhnya ke memori
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for number, text in expressions:
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    summary.add(_write(out, future.result()))
+            pending.add(executor.submit(classify_one, pool, number, text, timeout))
+        for future in wait(pending).done:
+            summary.add(_write(out, future.result()))
+    return summary
+
+
+def _write(out, record):
+    out.write(json.dumps(record, ensure_ascii=False) + "\n")
+    out.flush()
+    return record
+
+
+class BatchSummary:
+    """Ringkasan berjalan: hitungan per status/klasifikasi dan `slowest` record paling lambat.
+
+    Memori tetap konstan berapa pun panjang file (record lain tidak disimpan).
+    """
+
+    def __init__(self, slowest=5):
+        self.total = 0
+        self.statuses = Counter()
+        self.classes = Counter()
+        self.slowest = slowest
+        self._heap = []  # Min-heap (ms, baris, record) berisi record paling lambat
+
+    def add(self, record):
+        self.total += 1
+        self.statuses[record["status"]] += 1
+        if record["status"] == "ok":
+            self.classes[record["class"]] += 1
+        entry = (record["ms"], record["line"], record)
+        if len(self._heap) < self.slowest:
+            heapq.heappush(self._heap, entry)
+        elif self.slowest:
+            heapq.heappushpop(self._heap, entry)
+
+    def report(self, seconds):
+        """Teks ringkasan: jumlah per status/klasifikasi, throughput, dan ekspresi paling lambat."""
+        lines = [
+            f"{self.total} ekspresi dalam {seconds:.2f} s ({self.total / max(seconds, 1e-9):.1f} ekspresi/detik)",
+            "Status: " + ", ".join(f"{name} {count}" for name, count in self.statuses.most_common()),
+            "Klasifikasi: " + ", ".join(f"{name} {count}" for name, count in self.classes.most_common()),
+            f"{self.slowest} paling lambat:",
+        ]
+        for _, _, record in sorted(self._heap, reverse=True):
+            lines.append(f"  baris {record['line']}: {record['ms']:.0f} ms [{record['status']}] {record['f']}")
+        return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Klasifikasi genap/ganjil massal (satu fungsi per baris).")
+    parser.add_argument("input", type=argparse.FileType("r", encoding="utf-8"),
+                        help="File berisi satu ekspresi per baris ('-' untuk stdin)")
+    parser.add_argument("-o", "--output", type=argparse.FileType("w", encoding="utf-8"), default="-",
+                        help="File JSON lines hasil (default: stdout)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Jumlah proses pekerja")
+    parser.add_argument("--timeout", type=float, default=DEADLINE, help="Batas waktu per ekspresi (detik)")
+    parser.add_argument("--slowest", type=int, default=5, help="Jumlah ekspresi paling lambat di ringkasan")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    summary = run_batch(read_expressions(args.input), args.output, args.workers, args.timeout, args.slowest)
+    print(summary.report(time.perf_counter() - start), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Turunan pertama/kedua, titik kritis, dan titik belok di interval grafik.
+
+f'(x) dan f''(x) dihitung simbolik dengan `diff`, lalu dikompilasi ke NumPy
+(lewat `function_cache`) agar akarnya bisa dicari secara vektor dengan
+`find_roots`. Hasilnya juga dicek terhadap paritas fungsi: turunan fungsi
+genap adalah fungsi ganjil (dan sebaliknya), dan titik kritis fungsi genap
+maupun ganjil selalu berpasangan di x dan -x.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+from sympy import Derivative, Symbol, diff
+
+from numeric import find_roots, function_cache, x
+from parity import EVEN, ODD, numeric_parity
+
+SYMMETRY_TOL = 1e-6  # Toleransi pasangan titik x dan -x
+STEP = 1e-4          # Jarak ke kiri/kanan titik kritis untuk uji tanda f'(x)
+
+# Diturunkan terhadap x real agar |x|, re(x), dst. punya turunan yang bisa dievaluasi NumPy
+x_real = Symbol("x", real=True)
+
+Derivatives = namedtuple("Derivatives", ["f1", "f2", "critical", "inflection", "consistency"])
+
+
+def _points(f, xs):
+    """(x, f(x)) untuk titik-titik yang f-nya terdefinisi."""
+    ys = f(xs)
+    keep = np.isfinite(ys)
+    return xs[keep], ys[keep]
+
+
+def _symmetric(xs):
+    """True jika setiap titik x (terurut) punya pasangan -x."""
+    if not len(xs):
+        return True
+    mirror = -xs[::-1]
+    nearest = np.clip(np.searchsorted(xs, mirror), 1, len(xs) - 1)
+    gap = np.minimum(np.abs(xs[nearest] - mirror), np.abs(xs[nearest - 1] - mirror))
+    return bool(np.all(gap <= SYMMETRY_TOL))
+
+
+def derivative_analysis(f_expr, result_type, interval):
+    """Turunan, titik kritis (x, f(x), jenis), titik belok (x, f(x)), dan cek konsistensi paritas."""
+    # Parameter lain (mis. a*x**2) membuat lambdify menghasilkan array ekspresi SymPy: detik, bukan milidetik
+    parameters = f_expr.free_symbols - {x}
+    if parameters:
+        names = ", ".join(sorted(str(symbol) for symbol in parameters))
+        raise ValueError(f"titik kritis hanya bisa dicari untuk fungsi x saja (ada parameter {names})")
+    f1_real = diff(f_expr.subs(x, x_real), x_real)
+    f1, f2 = (expr.subs(x_real, x) for expr in (f1_real, diff(f1_real, x_real)))
+    if f2.has(Derivative):
+        raise ValueError(f"turunan {f_expr} tidak punya bentuk eksplisit")
+    f, g1, g2 = (function_cache.get(expr) for expr in (f_expr, f1, f2))
+
+    # Jenis titik kritis dari uji turunan pertama (juga berlaku di sudut seperti |x|)
+    critical_x, critical_y = _points(f, find_roots(g1, *interval))
+    before, after = np.sign(g1(critical_x - STEP)), np.sign(g1(critical_x + STEP))
+    kinds = np.where((before < 0) & (after > 0), "minimum lokal",
+                     np.where((before > 0) & (after < 0), "maksimum lokal", "datar"))
+    critical = list(zip(critical_x.tolist(), critical_y.tolist(), kinds.tolist()))
+
+    inflection_x, inflection_y = _points(f, find_roots(g2, *interval, crossing_only=True))
+    inflection = list(zip(inflection_x.tolist(), inflection_y.tolist()))
+
+    # Paritas turunan dicek numerik; titik kritis/belok harus simetris terhadap x = 0
+    consistency = []
+    if result_type in (EVEN, ODD):
+        f1_even, f1_odd = numeric_parity(f1)
+        f2_even, f2_odd = numeric_parity(f2)
+        if result_type == EVEN:
+            consistency.append(("f'(x) ganjil", f1_odd))
+            consistency.append(("f''(x) genap", f2_even))
+        else:
+            consistency.append(("f'(x) genap", f1_even))
+            consistency.append(("f''(x) ganjil", f2_odd))
+        consistency.append(("titik kritis berpasangan di x dan -x", _symmetric(critical_x)))
+        consistency.append(("titik belok berpasangan di x dan -x", _symmetric(inflection_x)))
+    return Derivatives(f1, f2, critical, inflection, consistency)
@@ -0,0 +1,271 @@
+"""Evaluasi numerik ekspresi SymPy: kompilasi ke NumPy dan cache bersama.
+
+Ekspresi dikompilasi sekali dengan `lambdify` menjadi fungsi NumPy yang
+menerima satu array titik x sekaligus, sehingga seribu titik cukup satu
+panggilan (sekitar satu milidetik) alih-alih seribu `subs`. Hasil kompilasi
+disimpan di cache LRU terbatas per proses yang dipakai bersama oleh semua
+sesi Streamlit.
+"""
+
+import math
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from sympy import lambdify, symbols
+
+x = symbols('x')
+CACHE_SIZE = 256     # Jumlah ekspresi terkompilasi yang disimpan
+SCALAR_POINTS = 2001  # Grid find_roots untuk fungsi yang dihitung per titik
+
+# Fungsi tanpa padanan NumPy; DiracDelta (mis. turunan kedua |x|) bernilai 0 di luar x = 0
+NUMPY_EXTRAS = {"DiracDelta": lambda values, *order: np.zeros_like(values)}
+# Cadangan per titik untuk fungsi khusus yang butuh SciPy di NumPy (gamma, erf, besselj, zeta, ...)
+SCALAR_MODULES = [{"factorial": lambda value: math.gamma(value + 1)}, "math", "mpmath"]
+
+
+def compile_function(expr, var=x):
+    """Mengompilasi ekspresi menjadi fungsi NumPy: array x -> array float (NaN di luar domain real).
+
+    Tanpa SciPy, lambdify NumPy tidak mengenal fungsi khusus (gamma, erf,
+    besselj, zeta, ...); ekspresi seperti itu dihitung per titik dengan
+    math/mpmath dan ditandai `vectorized = False` karena jauh lebih lambat.
+    """
+    extra = expr.free_symbols - {var}
+    if extra:
+        raise ValueError(f"ekspresi hanya boleh memuat {var} (ada {', '.join(sorted(map(str, extra)))})")
+    # cse: subekspresi berulang (khas turunan hasil aturan rantai) dihitung sekali per panggilan
+    func = lambdify(var, expr, modules=[NUMPY_EXTRAS, "numpy"], cse=True)
+    try:
+        with np.errstate(all="ignore"):
+            func(np.array([0.5]))
+        vectorized = True
+    except (NameError, TypeError):
+        scalar = lambdify(var, expr, modules=SCALAR_MODULES)
+
+        def evaluate_scalar(value):
+            try:
+                y = complex(scalar(value))
+            except (ArithmeticError, TypeError, ValueError):
+                # Kutub atau di luar domain, mis. gamma(-1)
+                return np.nan
+            return y.real if abs(y.imag) < 1e-12 else np.nan
+
+        func = np.vectorize(evaluate_scalar, otypes=[float])
+        vectorized = False
+
+    def evaluate(values):
+        values = np.asarray(values, dtype=float)
+        with np.errstate(all="ignore"):
+            y = np.asarray(func(values))
+        if np.iscomplexobj(y):
+            # Nilai kompleks (mis. sqrt bilangan negatif) tidak diplot
+            y = np.where(np.abs(y.imag) < 1e-12, y.real, np.nan)
+        # Ekspresi konstan menghasilkan skalar, disebar ke bentuk input
+        return np.broadcast_to(y.astype(float, copy=False), values.shape)
+
+    evaluate.vectorized = vectorized
+    return evaluate
+
+
+class LRUCache:
+    """Cache LRU terbatas yang aman antar-thread, dengan hitungan hit/miss untuk UI.
+
+    Dipakai untuk semua cache per proses di aplikasi ini (fungsi terkompilasi,
+    klasifikasi, hasil analisis). Nilai None tidak bisa disimpan karena
+    `get` memakai None untuk "tidak ada".
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Nilai untuk `key` (ditandai baru dipakai), atau None jika tidak ada."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        """Menyimpan `value`; entri yang paling lama tidak dipakai dibuang jika cache penuh."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        """(hit, miss, jumlah entri) untuk ditampilkan di UI."""
+        with self._lock:
+            return self.hits, self.misses, len(self._entries)
+
+
+class FunctionCache(LRUCache):
+    """Fungsi NumPy terkompilasi per ekspresi SymPy."""
+
+    def __init__(self, maxsize=CACHE_SIZE):
+        super().__init__(maxsize)
+
+    def get(self, expr):
+        """Fungsi terkompilasi untuk `expr`; dikompilasi dan disimpan jika belum ada."""
+        func = super().get(expr)
+        if func is None:
+            func = compile_function(expr)
+            self.put(expr, func)
+        return func
+
+
+# Satu cache per proses, dipakai bersama oleh semua sesi
+function_cache = FunctionCache()
+
+
+# --- Sampling Adaptif ---
+
+def adaptive_sample(f, a, b, initial=64, max_depth=10, tol=2e-3, jump_tol=0.05):
+    """Sampling adaptif `f` di [a, b] untuk grafik.
+
+    Dimulai dari grid `initial` interval; setiap interval dibelah dua selama
+    titik tengahnya menyimpang dari garis lurus kedua ujungnya lebih dari
+    `tol` x rentang y (atau salah satu ujungnya di luar domain). Bagian yang
+    seluruhnya jauh di luar rentang y tidak dihaluskan karena tidak akan
+    terlihat. Semua titik tengah satu tingkat dievaluasi dalam satu panggilan
+    vektor. Interval yang
+    masih melompat lebih dari `jump_tol` x rentang y setelah `max_depth`
+    pembelahan dianggap diskontinu (kutub atau loncatan) dan garis diputus
+    di sana. Mengembalikan (daftar segmen (x, y), jumlah evaluasi f).
+    """
+    xs = np.linspace(a, b, initial + 1)
+    ys = np.asarray(f(xs), dtype=float)
+    evaluations = len(xs)
+    finite = ys[np.isfinite(ys)]
+    if len(finite) == 0:
+        return [], evaluations
+    low, high = np.quantile(finite, (0.05, 0.95))
+    scale = max(high - low, 1e-12 * max(1.0, abs(high)))
+    window_low, window_high = low - 3 * scale, high + 3 * scale
+
+    def visible(y):
+        return (y >= window_low) & (y <= window_high)
+
+    points_x, points_y = [xs], [ys]
+    xl, xr, yl, yr = xs[:-1], xs[1:], ys[:-1], ys[1:]
+    with np.errstate(all="ignore"):
+        # inf - inf dan luapan di dekat kutub cukup menjadi NaN/inf, tanpa RuntimeWarning
+        for _ in range(max_depth):
+            xm = (xl + xr) / 2
+            ym = np.asarray(f(xm), dtype=float)
+            evaluations += len(xm)
+            points_x.append(xm)
+            points_y.append(ym)
+            ok = np.isfinite(yl) & np.isfinite(yr) & np.isfinite(ym)
+            seen = visible(yl) | visible(ym) | visible(yr)
+            edge = ~ok & seen  # Batas domain (atau kutub tepat di titik grid)
+            above = (yl > window_high) & (ym > window_high) & (yr > window_high)
+            below = (yl < window_low) & (ym < window_low) & (yr < window_low)
+            bent = ok & ~above & ~below & (np.abs(ym - (yl + yr) / 2) > tol * scale)
+            refine = edge | bent
+            if not refine.any():
+                xl = xr = yl = yr = xl[:0]
+                break
+            xl, xm, xr = xl[refine], xm[refine], xr[refine]
+            yl, ym, yr = yl[refine], ym[refine], yr[refine]
+            xl, xr = np.concatenate((xl, xm)), np.concatenate((xm, xr))
+            yl, yr = np.concatenate((yl, ym)), np.concatenate((ym, yr))
+
+        # Interval yang tetap curam setelah pembelahan terakhir: putus garis di sana
+        breaks = xl[np.isfinite(yl) & np.isfinite(yr) & (np.abs(yr - yl) > jump_tol * scale)]
+
+    x_all = np.concatenate(points_x)
+    y_all = np.concatenate(points_y)
+    order = np.argsort(x_all, kind="stable")
+    x_all, y_all = x_all[order], y_all[order]
+    cut = ~np.isfinite(y_all[:-1]) | ~np.isfinite(y_all[1:]) | np.isin(x_all[:-1], breaks)
+    segments = []
+    for x_seg, y_seg in zip(np.split(x_all, np.flatnonzero(cut) + 1), np.split(y_all, np.flatnonzero(cut) + 1)):
+        keep = np.isfinite(y_seg)
+        if keep.sum() >= 2:
+            segments.append((x_seg[keep], y_seg[keep]))
+    return segments, evaluations
+
+
+def robust_ylim(segments, quantiles=(0.01, 0.99), margin=0.08):
+    """Batas sumbu y dari kuantil y berbobot lebar interval (titik rapat di dekat kutub tidak mendominasi).
+
+    Jika tidak ada pencilan, seluruh kurva ditampilkan; jika ada (mis. 1/x,
+    tan(x)), batas diambil dari kuantil agar bagian yang landai tetap terlihat.
+    """
+    if not segments:
+        return -1.0, 1.0
+    ys = np.concatenate([y_seg for _, y_seg in segments])
+    weights = np.concatenate([np.gradient(x_seg) for x_seg, _ in segments])
+    order = np.argsort(ys)
+    ys, weights = ys[order], weights[order]
+    cumulative = np.cumsum(weights) / weights.sum()
+    low, high = np.interp(quantiles, cumulative, ys)
+    if ys[-1] - ys[0] <= 3 * (high - low):
+        low, high = ys[0], ys[-1]
+    if high - low <= 1e-12 * max(abs(low), abs(high), 1.0):
+        # Fungsi konstan (termasuk galat pembulatan, mis. cos(x)**2 + sin(x)**2): tidak ada
+        # skala dari data, beri ruang tetap di sekitar nilainya
+        center = (low + high) / 2
+        pad = max(1.0, abs(center) * 0.1)
+        return center - pad, center + pad
+    pad = (high - low) * margin
+    return low - pad, high + pad
+
+
+# --- Pencarian Akar ---
+
+def find_roots(g, a, b, points=20001, iterations=40, xtol=1e-12, tol=1e-6, crossing_only=False):
+    """Akar `g` di [a, b]: perubahan tanda dikurung di grid rapat, lalu semua kurung dihaluskan serentak.
+
+    Penghalusan memakai metode Illinois (regula falsi yang nilai ujung
+    lamanya dibagi dua) dan berhenti jika semua kurung lebih sempit dari
+    `xtol`; setiap iterasi mengevaluasi semua kurung yang belum konvergen
+    dalam satu panggilan vektor. Perubahan tanda karena kutub (mis. 1/x)
+    ditolak karena |g| di titik hasil tidak mendekati nol. Nol yang tepat
+    jatuh di titik grid ikut dihitung jika terisolasi (g yang nol di seluruh
+    interval tidak punya akar terpisah); dengan `crossing_only`, hanya jika
+    tanda g berganti di sana. Akar yang menyinggung sumbu di antara titik
+    grid tidak ditemukan. Fungsi yang dihitung per titik (`vectorized` False)
+    memakai grid `SCALAR_POINTS` agar tetap dalam tenggat pekerja.
+    """
+    if not getattr(g, "vectorized", True):
+        points = min(points, SCALAR_POINTS)
+    xs = np.linspace(a, b, points)
+    ys = np.asarray(g(xs), dtype=float)
+    finite = np.isfinite(ys)
+    if not finite.any():
+        return np.empty(0)
+    signs = np.where(finite, np.sign(ys), np.nan)
+    bracket = signs[:-1] * signs[1:] < 0
+    # `new` adalah titik terbaru, `old` ujung kurung di seberangnya
+    old, new = xs[:-1][bracket], xs[1:][bracket]
+    y_old, y_new = ys[:-1][bracket], ys[1:][bracket]
+    with np.errstate(all="ignore"):
+        for _ in range(iterations):
+            # Hanya kurung yang belum konvergen yang dievaluasi lagi
+            active = np.flatnonzero(np.abs(new - old) > xtol)
+            if not len(active):
+                break
+            o, n, yo, yn = old[active], new[active], y_old[active], y_new[active]
+            mid = (o * yn - n * yo) / (yn - yo)
+            y_mid = np.asarray(g(mid), dtype=float)
+            flipped = np.sign(y_mid) != np.sign(yn)
+            old[active], y_old[active] = np.where(flipped, n, o), np.where(flipped, yn, yo / 2)
+            new[active], y_new[active] = mid, y_mid
+        roots = new[np.abs(y_new) <= tol * max(1.0, float(np.median(np.abs(ys[finite]))))]
+
+    left, right = signs[:-2], signs[2:]
+    isolated = (signs[1:-1] == 0) & (np.abs(left) == 1) & (np.abs(right) == 1)
+    if crossing_only:
+        isolated &= left * right < 0
+    return np.sort(np.concatenate((roots, xs[1:-1][isolated])))
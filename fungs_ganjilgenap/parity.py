@@ -0,0 +1,120 @@
+"""Klasifikasi fungsi genap/ganjil: uji numerik cepat, bukti simbolik, dan cache.
+
+`f(x)` dan `f(-x)` lebih dulu dievaluasi di sejumlah titik acak (tetap) dalam
+satu panggilan NumPy. Satu titik yang melanggar `f(-x) = f(x)` sudah cukup
+untuk menolak kemungkinan genap (begitu pula ganjil), jadi `equals` SymPy
+yang lambat hanya dijalankan untuk kandidat yang lolos. Hasil disimpan per
+bentuk kanonik ekspresi (`sympify` sudah mengurutkan suku secara kanonik),
+sehingga `x**2 + 4` dan `4 + x**2` memakai entri yang sama.
+"""
+
+import numpy as np
+from sympy import srepr, sympify
+
+from numeric import LRUCache, compile_function, function_cache, x
+
+EVEN = "Genap (Even)"
+ODD = "Ganjil (Odd)"
+NEITHER = "Bukan Ganjil dan Bukan Genap (Neither)"
+
+CACHE_SIZE = 1024
+MIN_POINTS = 4   # Titik valid minimum agar uji numerik dianggap bermakna
+RTOL = 1e-8      # Toleransi relatif perbandingan f(-x) dengan +-f(x)
+
+# Titik uji positif, tersebar log-uniform di [0.01, 20] (tetap agar hasil deterministik)
+SAMPLE_POINTS = np.exp(np.random.default_rng(2024).uniform(np.log(0.01), np.log(20), 32))
+
+
+def numeric_parity(f_expr, var=x):
+    """Uji cepat di titik sampel; mengembalikan (mungkin genap, mungkin ganjil).
+
+    (True, True) berarti uji tidak bisa memutuskan (ekspresi tidak bisa
+    dievaluasi numerik atau titik valid terlalu sedikit).
+    """
+    try:
+        f = function_cache.get(f_expr) if var == x else compile_function(f_expr, var)
+        y_pos = f(SAMPLE_POINTS)
+        y_neg = f(-SAMPLE_POINTS)
+    except Exception:
+        return True, True
+    valid = np.isfinite(y_pos) & np.isfinite(y_neg)
+    if valid.sum() < MIN_POINTS:
+        return True, True
+    y_pos, y_neg = y_pos[valid], y_neg[valid]
+    scale = np.maximum(1.0, np.maximum(np.abs(y_pos), np.abs(y_neg)))
+    maybe_even = bool(np.all(np.abs(y_neg - y_pos) <= RTOL * scale))
+    maybe_odd = bool(np.all(np.abs(y_neg + y_pos) <= RTOL * scale))
+    return maybe_even, maybe_odd
+
+
+def classify_function(f_expr, x):
+    """Mengklasifikasikan fungsi berdasarkan definisi aljabar."""
+    try:
+        f_neg_x = f_expr.subs(x, -x)
+        neg_f_x = -f_expr
+
+        # Bukti simbolik hanya untuk kandidat yang lolos uji numerik
+        maybe_even, maybe_odd = numeric_parity(f_expr, x)
+        is_even = maybe_even and f_neg_x.equals(f_expr)
+        is_odd = not is_even and maybe_odd and f_neg_x.equals(neg_f_x)
+
+        if is_even:
+            return EVEN, f_neg_x, neg_f_x
+        elif is_odd:
+            return ODD, f_neg_x, neg_f_x
+        else:
+            return NEITHER, f_neg_x, neg_f_x
+    except Exception as e:
+        return f"Error: {e}", None, None
+
+
+def canonical_key(f_expr):
+    """Kunci cache dari bentuk kanonik ekspresi (urutan suku sudah dinormalkan oleh SymPy)."""
+    return srepr(f_expr)
+
+
+# --- Cache Klasifikasi ---
+
+class ParityCache:
+    """Dua cache LRU: teks input -> ekspresi, bentuk kanonik -> klasifikasi.
+
+    Teks yang persis sama dengan input sebelumnya langsung dikenali tanpa
+    `sympify` ulang. Hit/miss yang dilaporkan adalah milik cache klasifikasi.
+    """
+
+    def __init__(self, maxsize=CACHE_SIZE):
+        self._entries = LRUCache(maxsize)
+        self._aliases = LRUCache(maxsize)  # Teks input -> ekspresi hasil sympify
+
+    def parse(self, text):
+        """`sympify` dengan cache per teks input (spasi di tepi diabaikan)."""
+        text = text.strip()
+        f_expr = self._aliases.get(text)
+        if f_expr is None:
+            f_expr = sympify(text)
+            self._aliases.put(text, f_expr)
+        return f_expr
+
+    def classify(self, f_expr):
+        """(klasifikasi, f(-x), -f(x)) dari cache; dihitung dengan `classify_function` jika belum ada."""
+        key = canonical_key(f_expr)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = classify_function(f_expr, x)
+            if not entry[0].startswith("Error"):
+                self._entries.put(key, entry)
+        return entry
+
+    def stats(self):
+        """(hit, miss, jumlah entri) untuk ditampilkan di UI."""
+        return self._entries.stats()
+
+
+# Hidup di setiap proses pekerja, sehingga entri bertahan antar-job selama pekerja tidak diganti
+parity_cache = ParityCache()
+
+
+def classify_text(text):
+    """Parse lalu klasifikasi satu teks; (klasifikasi, f(-x), -f(x)) sebagai string agar mudah dikirim antar-proses."""
+    result_type, f_neg_x, neg_f_x = parity_cache.classify(parity_cache.parse(text))
+    return result_type, str(f_neg_x), str(neg_f_x)
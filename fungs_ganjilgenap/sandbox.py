@@ -0,0 +1,184 @@
+"""Pool proses pekerja terisolasi untuk pekerjaan yang bisa berjalan tanpa batas.
+
+Setiap pekerja adalah proses terpisah yang di-fork dari forkserver yang sudah
+mengimpor modul berat (SymPy, NumPy), lalu menjalankan `warmup` sebelum
+menerima job. Pekerja baru masuk antrean hanya setelah mengirim pesan
+"ready" (warm-up selesai), jadi warm-up tidak pernah memakan batas waktu
+job berikutnya. Setiap job punya batas waktu keras; jika terlewati, atau jika
+job dibatalkan, proses pekerjanya dibunuh dan diganti pekerja baru. Memori
+setiap pekerja dibatasi dengan RLIMIT_AS, sehingga input yang meledak menjadi
+MemoryError di pekerja, bukan di server. Pekerja yang crash juga diganti.
+"""
+
+import multiprocessing
+import os
+import queue
+import resource
+import threading
+import time
+
+DEADLINE = 5.0                 # Batas waktu per job (detik)
+MEMORY_LIMIT = 512 * 1024**2   # Batas ruang alamat per pekerja (byte)
+MAX_JOBS_PER_WORKER = 500      # Pekerja diganti setelah sekian job agar memori tidak terus tumbuh
+POLL_INTERVAL = 0.1            # Jeda pemeriksaan hasil (detik); `on_tick` dipanggil setiap jeda
+WARMUP_TIMEOUT = 30.0          # Pekerja yang belum siap setelah sekian detik diganti
+RESPAWN_DELAY = 0.5            # Jeda awal sebelum mengganti pekerja yang gagal warm-up (detik)
+MAX_RESPAWN_DELAY = 30.0       # Jeda maksimal; jeda digandakan setiap kegagalan berturut-turut
+
+
+class JobTimeout(Exception):
+    """Job melewati batas waktu (atau tidak ada pekerja yang bebas sebelum batas waktu)."""
+
+
+class WorkerCrashed(Exception):
+    """Proses pekerja mati atau kehabisan memori saat menjalankan job."""
+
+
+class JobFailed(Exception):
+    """Job melempar exception biasa di pekerja; pesan aslinya dibawa sebagai teks."""
+
+
+def _worker_main(conn, memory_limit, warmup):
+    """Loop proses pekerja: ("ready", None) setelah warm-up, lalu (fungsi, argumen) -> ("ok", hasil) atau ("error", pesan)."""
+    if memory_limit:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+    if warmup:
+        warmup()
+    conn.send(("ready", None))
+    while True:
+        try:
+            func, args = conn.recv()
+        except EOFError:
+            return
+        try:
+            conn.send(("ok", func(*args)))
+        except MemoryError:
+            conn.send(("memory", None))
+            return  # Heap bisa sudah rusak; pool akan mengganti pekerja ini
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+
+class _Worker:
+    def __init__(self, ctx, memory_limit, warmup):
+        self.conn, child = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child, memory_limit, warmup), daemon=True)
+        self.process.start()
+        child.close()
+        self.jobs = 0
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class Job:
+    """Job yang sedang berjalan di satu pekerja; `wait` untuk hasilnya, `cancel` untuk menghentikannya."""
+
+    def __init__(self, pool, worker, deadline):
+        self._pool = pool
+        self._worker = worker
+        self.started = time.monotonic()
+        self.deadline = deadline
+
+    @property
+    def done(self):
+        return self._worker is None
+
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    def wait(self, on_tick=None):
+        """Menunggu hasil hingga batas waktu; `on_tick(detik berlalu)` dipanggil setiap POLL_INTERVAL."""
+        worker = self._worker
+        while not worker.conn.poll(POLL_INTERVAL):
+            if not worker.process.is_alive():
+                self._finish(recycle=True)
+                raise WorkerCrashed("Proses pekerja berhenti tiba-tiba")
+            if self.elapsed() > self.deadline:
+                self.cancel()
+                raise JobTimeout(f"Melebihi batas waktu {self.deadline:.0f} detik")
+            if on_tick:
+                on_tick(self.elapsed())
+        try:
+            status, value = worker.conn.recv()
+        except (EOFError, OSError):
+            self._finish(recycle=True)
+            raise WorkerCrashed("Proses pekerja berhenti tiba-tiba")
+        if status == "memory":
+            self._finish(recycle=True)
+            raise WorkerCrashed(f"Melebihi batas memori {self._pool.memory_limit // 1024**2} MB")
+        self._finish(recycle=False)
+        if status == "error":
+            raise JobFailed(value)
+        return value
+
+    def cancel(self):
+        """Menghentikan job (proses pekerja dibunuh dan diganti); tidak berbuat apa-apa jika sudah selesai."""
+        if not self.done:
+            self._finish(recycle=True)
+
+    def _finish(self, recycle):
+        worker, self._worker = self._worker, None
+        self._pool._release(worker, recycle)
+
+
+class WorkerPool:
+    """Pool pekerja dengan batas waktu, batas memori, pembatalan, dan penggantian pekerja rusak."""
+
+    def __init__(self, size, preload=(), warmup=None, memory_limit=MEMORY_LIMIT):
+        self.memory_limit = memory_limit
+        self._ctx = multiprocessing.get_context("forkserver")
+        # Modul berat diimpor sekali di forkserver; pekerja baru tinggal di-fork (murah)
+        self._ctx.set_forkserver_preload(list(preload))
+        self._warmup = warmup
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self.recycled = 0
+        for _ in range(size):
+            self._start_worker()
+
+    def _start_worker(self):
+        """Menjalankan pekerja baru di latar; pekerja masuk antrean setelah warm-up selesai."""
+        threading.Thread(target=self._enqueue_when_ready, daemon=True).start()
+
+    def _enqueue_when_ready(self):
+        delay = RESPAWN_DELAY
+        while True:
+            worker = _Worker(self._ctx, self.memory_limit, self._warmup)
+            try:
+                ready = worker.conn.poll(WARMUP_TIMEOUT) and worker.conn.recv()[0] == "ready"
+            except (EOFError, OSError):
+                ready = False
+            if ready:
+                self._idle.put(worker)
+                return
+            # Warm-up macet atau crash: coba lagi dengan jeda yang makin panjang agar slot tidak hilang
+            worker.kill()
+            time.sleep(delay)
+            delay = min(delay * 2, MAX_RESPAWN_DELAY)
+
+    def submit(self, func, *args, deadline=DEADLINE):
+        """Mengirim `func(*args)` ke pekerja bebas; JobTimeout jika tidak ada yang bebas sebelum batas waktu."""
+        try:
+            worker = self._idle.get(timeout=deadline)
+        except queue.Empty:
+            raise JobTimeout("Semua pekerja sedang sibuk") from None
+        worker.jobs += 1
+        worker.conn.send((func, args))
+        return Job(self, worker, deadline)
+
+    def _release(self, worker, recycle):
+        if recycle or worker.jobs >= MAX_JOBS_PER_WORKER or not worker.process.is_alive():
+            worker.kill()
+            self._start_worker()
+            with self._lock:
+                self.recycled += 1
+            return
+        self._idle.put(worker)
+
+
+def default_pool_size():
+    """Minimal 2 agar satu job berat tidak menahan semua pengguna; maksimal 4."""
+    return max(2, min(4, os.cpu_count() or 1))
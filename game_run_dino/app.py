@@ -1,19 +1,23 @@
 import streamlit as st
 import time
 import random
-import numpy as np
-import matplotlib.pyplot as plt
+from collections import deque
+
+from autopilot import Autopilot
+from game_component import game_result, runner_game
+from leaderboard import Leaderboard
+from renderer import FrameRenderer, encode_frame
+from replay import ReplayPlayer, decode_replay, encode_replay, submit_validation
+from sim import DEFAULT_CONFIG, GAME_SPEED, GROUND_LEVEL, RUNNER_SIZE, RUNNER_X, GameState, step
+from timing import FixedTimestep, FrameStats
 
 # --- Game Configuration ---
-GROUND_LEVEL = 0.1  # Posisi Y tanah
-RUNNER_SIZE = 0.5   # Ukuran pelari (tinggi)
-OBSTACLE_HEIGHT_MIN = 0.3
-OBSTACLE_HEIGHT_MAX = 0.8
-OBSTACLE_WIDTH = 0.3
-JUMP_STRENGTH = 0.8 # Kekuatan lompatan awal
-GRAVITY = 0.08      # Kekuatan gravitasi
-GAME_SPEED = 0.08   # Kecepatan game (detik per frame)
-OBSTACLE_SPAWN_RATE = 0.02 # Probabilitas rintangan muncul setiap frame
+# Konstanta fisika ada di sim.py agar server, browser, dan simulasi batch memakai nilai yang sama
+GAME_CONFIG = DEFAULT_CONFIG
+GAME_MODES = ["Browser (ringan)", "Server"]
+PLAYBACK_SPEEDS = [1, 10, 50, 100] # Kelipatan kecepatan putar ulang replay
+LEADERBOARD_SIZE = 10
+JUMP_BUFFER_FRAMES = 4 # Tekanan lompat yang datang saat pelari di udara menunggu paling lama sekian frame
 
 # --- Warna Keren ---
 COLOR_BACKGROUND = '#87CEEB' # Sky Blue
@@ -22,78 +26,175 @@ COLOR_RUNNER = '#FF4500'     # Orange Red
 COLOR_OBSTACLE = '#6A5ACD'   # Slate Blue
 COLOR_TEXT = '#FFFFFF'       # White
 
+@st.cache_resource
+def get_leaderboard():
+    """Satu koneksi papan skor (SQLite WAL) per proses server, dipakai semua sesi."""
+    return Leaderboard()
+
+def player_name():
+    return st.session_state.get('player_name', '').strip() or "Anonim"
+
 # --- State Game Awal ---
 if 'game_started' not in st.session_state:
     st.session_state.game_started = False
-    st.session_state.runner_y = GROUND_LEVEL
-    st.session_state.runner_vy = 0 # Kecepatan vertikal pelari
-    st.session_state.obstacles = [] # Daftar rintangan: [(x, y, width, height), ...]
-    st.session_state.score = 0
-    st.session_state.frame_count = 0
-    st.session_state.game_over = False
+    st.session_state.game = GameState(0) # State simulasi: pelari, rintangan, skor, RNG
+    st.session_state.jump_queue = deque() # Frame saat tombol lompat ditekan, dipakai langkah berikutnya
 
 def reset_game():
     st.session_state.game_started = True
-    st.session_state.runner_y = GROUND_LEVEL
-    st.session_state.runner_vy = 0
-    st.session_state.obstacles = []
-    st.session_state.score = 0
-    st.session_state.frame_count = 0
-    st.session_state.game_over = False
+    st.session_state.game = GameState(random.getrandbits(32))
+    st.session_state.jump_queue = deque()
+    st.session_state.jump_log = [] # Frame lompatan yang benar-benar terjadi (untuk replay)
+    st.session_state.pilot = Autopilot(GAME_CONFIG)
+    st.session_state.autopilot_used = False # Skor dengan bantuan autopilot tidak masuk papan skor
+    st.session_state.clock = FixedTimestep(GAME_SPEED) # Langkah simulasi mengikuti waktu nyata
+    st.session_state.frame_stats = FrameStats()
+    st.session_state.last_tick = None
+    st.session_state.last_frame = None
 
 def update_game_state():
-    if st.session_state.game_over:
-        return
+    """Satu langkah simulasi; tekanan lompat tertua di antrean dipakai begitu pelari bisa melompat."""
+    game = st.session_state.game
+    frame = game.frame_count
+    queue = st.session_state.jump_queue
+    while queue and frame - queue[0] > JUMP_BUFFER_FRAMES:
+        queue.popleft() # Terlalu lama menunggu di udara, dianggap kedaluwarsa
+    wanted = bool(queue)
+    if st.session_state.get('autopilot'):
+        st.session_state.autopilot_used = True
+        wanted |= st.session_state.pilot.decide(game)
+    if step(game, jump=wanted):
+        st.session_state.jump_log.append(frame)
+        if queue:
+            queue.popleft() # Satu tekanan = satu lompatan
+    if game.game_over:
+        st.session_state.last_replay = encode_replay(game.seed, st.session_state.jump_log, game.score)
+        if not st.session_state.autopilot_used:
+            get_leaderboard().submit(player_name(), game.score, st.session_state.last_replay)
 
-    # Update Runner Position (Jump & Gravity)
-    st.session_state.runner_y += st.session_state.runner_vy
-    st.session_state.runner_vy -= GRAVITY # Gravitasi menarik ke bawah
-
-    if st.session_state.runner_y <= GROUND_LEVEL:
-        st.session_state.runner_y = GROUND_LEVEL
-        st.session_state.runner_vy = 0
-
-    # Update Obstacles
-    new_obstacles = []
-    for obs_x, obs_y, obs_w, obs_h in st.session_state.obstacles:
-        obs_x -= 0.1 # Rintangan bergerak ke kiri
-        if obs_x > -OBSTACLE_WIDTH: # Hapus rintangan yang sudah keluar layar
-            new_obstacles.append((obs_x, obs_y, obs_w, obs_h))
-    st.session_state.obstacles = new_obstacles
-
-    # Spawn New Obstacle
-    if random.random() < OBSTACLE_SPAWN_RATE and len(st.session_state.obstacles) < 2:
-        if not st.session_state.obstacles or st.session_state.obstacles[-1][0] < 0.7: # Pastikan ada jarak antar rintangan
-            obs_height = random.uniform(OBSTACLE_HEIGHT_MIN, OBSTACLE_HEIGHT_MAX)
-            st.session_state.obstacles.append((1.0, GROUND_LEVEL, OBSTACLE_WIDTH, obs_height)) # x=1.0 adalah batas kanan layar
-
-    # Collision Detection
-    runner_hitbox = {
-        'x_min': 0.1, 'x_max': 0.1 + RUNNER_SIZE/2,
-        'y_min': st.session_state.runner_y, 'y_max': st.session_state.runner_y + RUNNER_SIZE
-    }
-    
-    for obs_x, obs_y, obs_w, obs_h in st.session_state.obstacles:
-        obstacle_hitbox = {
-            'x_min': obs_x, 'x_max': obs_x + obs_w,
-            'y_min': obs_y, 'y_max': obs_y + obs_h
-        }
-
-        if (runner_hitbox['x_max'] > obstacle_hitbox['x_min'] and
-            runner_hitbox['x_min'] < obstacle_hitbox['x_max'] and
-            runner_hitbox['y_max'] > obstacle_hitbox['y_min'] and
-            runner_hitbox['y_min'] < obstacle_hitbox['y_max']):
-            
-            st.session_state.game_over = True
-            break
-            
-    # Update Score
-    st.session_state.score += 1
-    st.session_state.frame_count += 1
+def get_renderer():
+    """Renderer framebuffer per sesi (buffer dipakai ulang di setiap frame)."""
+    if 'renderer' not in st.session_state:
+        st.session_state.renderer = FrameRenderer(
+            COLOR_BACKGROUND, COLOR_GROUND, COLOR_RUNNER, COLOR_OBSTACLE, COLOR_TEXT, GROUND_LEVEL
+        )
+    return st.session_state.renderer
+
+def render_frame(game, stats=None):
+    """Menggambar state game ke framebuffer dan mengembalikan gambar JPEG."""
+    obstacles = [(obs_x, obs_y + GROUND_LEVEL, obs_w, obs_h)
+                 for obs_x, obs_y, obs_w, obs_h in game.obstacle_boxes()]
+    start = time.perf_counter()
+    frame = get_renderer().render(RUNNER_X, game.runner_y + GROUND_LEVEL, RUNNER_SIZE/2, RUNNER_SIZE,
+                                  obstacles, game.score)
+    if stats:
+        stats.record("render", (time.perf_counter() - start) * 1000)
+    start = time.perf_counter()
+    image = encode_frame(frame)
+    if stats:
+        stats.record("encode", (time.perf_counter() - start) * 1000)
+    return image
 
 def jump():
-    if st.session_state.runner_y == GROUND_LEVEL and not st.session_state.game_over:
-        st.session_state.runner_vy = JUMP_STRENGTH
+    # Callback tombol: masuk antrean sebelum tick berikutnya berjalan, jadi tidak ada klik yang hilang
+    st.session_state.jump_queue.append(st.session_state.game.frame_count)
+
+@st.fragment(run_every=GAME_SPEED)
+def game_loop():
+    """Satu tick game: hanya kanvas dan tombol lompat yang dijalankan ulang, bukan seluruh script."""
+    cpu_start = time.thread_time()
+    stats = st.session_state.frame_stats
+    now = time.perf_counter()
+    if st.session_state.last_tick is not None:
+        stats.record("tick", (now - st.session_state.last_tick) * 1000)
+    st.session_state.last_tick = now
+
+    # Update state: jalankan sebanyak langkah yang dituntut waktu nyata
+    steps, discarded = st.session_state.clock.advance()
+    for _ in range(steps):
+        update_game_state()
+        if st.session_state.game.game_over:
+            break
+    stats.record("update", (time.perf_counter() - now) * 1000)
+
+    # Hanya state terakhir yang dirender; langkah lain adalah frame yang terlewat.
+    # Tick tanpa langkah (mis. dipicu klik lompat) memakai ulang gambar sebelumnya.
+    if steps or st.session_state.last_frame is None:
+        st.session_state.last_frame = render_frame(st.session_state.game, stats)
+        stats.frames += 1
+        stats.dropped += max(steps - 1, 0) + discarded
+    st.image(st.session_state.last_frame)
+
+    if st.session_state.game.game_over:
+        st.rerun() # Rerun penuh sekali untuk layar game over; fragment tidak dipanggil lagi
+
+    col_buttons = st.columns([1, 1, 1])
+    with col_buttons[1]: # Tengah
+        st.button("Lompat!", key="jump_btn", on_click=jump, help="Tekan untuk membuat pelari melompat!")
+
+    with st.expander("Instrumentasi frame"):
+        st.markdown(stats.summary())
+        st.caption(f"Frame dirender: {stats.frames} · frame terlewat: {stats.dropped}")
+        share = stats.cpu_share(GAME_SPEED)
+        if share is not None:
+            st.caption(f"CPU server per pemain: {share:.1%} dari satu core")
+        if st.session_state.get('autopilot') and st.session_state.pilot.plan_ms:
+            st.caption(f"Rencana autopilot: {max(st.session_state.pilot.plan_ms):.2f} ms (maks 300 frame terakhir)")
+    stats.record("cpu", (time.thread_time() - cpu_start) * 1000)
+
+def submit_browser_result():
+    """Menerima hasil game dari browser (sekali per game) lalu memberi seed baru."""
+    result = game_result(st.session_state.browser_game)
+    if result is None:
+        return
+    seed, score, frames, jumps = result
+    if seed != st.session_state.browser_seed:
+        return # Kiriman ulang untuk game yang sudah dicatat
+    st.session_state.browser_seed = random.getrandbits(32)
+    # Pemeriksaan dasar: skor bertambah satu per frame, lompatan urut dan di dalam run
+    ordered = all(a < b for a, b in zip([-1] + jumps, jumps))
+    if not (score == frames and ordered and (not jumps or jumps[-1] < frames)):
+        st.session_state.browser_last = (score, len(jumps), False)
+        return
+    # Skor diverifikasi dengan mensimulasikan ulang replay di thread latar
+    replay = encode_replay(seed, jumps, score)
+    st.session_state.last_replay = replay
+    st.session_state.browser_pending = (submit_validation(replay, score), score, len(jumps))
+
+@st.fragment(run_every=0.5)
+def validation_status():
+    """Menunggu hasil validator tanpa menahan rerun; rerun penuh sekali saat selesai."""
+    future, score, jump_count = st.session_state.browser_pending
+    if not future.done():
+        st.info(f"Memverifikasi skor {score} lewat replay...")
+        return
+    valid, _ = future.result()
+    st.session_state.browser_pending = None
+    st.session_state.browser_last = (score, jump_count, valid)
+    if valid:
+        st.session_state.browser_best = max(st.session_state.browser_best, score)
+        get_leaderboard().submit(player_name(), score, st.session_state.last_replay)
+    st.rerun()
+
+def start_playback(data, speed):
+    """Memulai pemutaran replay; kecepatan >1 menjalankan beberapa frame per render."""
+    seed, jumps, score = decode_replay(data)
+    st.session_state.playback = (ReplayPlayer(seed, jumps), speed, score)
+    st.session_state.playback_clock = FixedTimestep(GAME_SPEED)
+
+def stop_playback():
+    st.session_state.playback = None
+
+@st.fragment(run_every=GAME_SPEED)
+def playback_view():
+    """Putar ulang: `speed` langkah simulasi per langkah waktu, hanya frame terakhir yang dirender."""
+    player, speed, _ = st.session_state.playback
+    steps, _ = st.session_state.playback_clock.advance()
+    state = player.advance(steps * speed)
+    st.image(render_frame(state))
+    st.caption(f"Memutar replay {speed}x · frame {state.frame_count}")
+    if state.game_over:
+        st.rerun() # Rerun penuh sekali untuk menampilkan hasil; fragment tidak dipanggil lagi
 
 # --- Streamlit UI ---
 st.set_page_config(
@@ -107,71 +208,102 @@ st.title("🏃‍♂️ Pixel Runner: Game Lompat Menarik!")
 # Placeholder untuk game
 game_placeholder = st.empty()
 
-# Tombol untuk memulai/melompat
-col_buttons = st.columns([1, 1, 1])
-with col_buttons[1]: # Tengah
-    if not st.session_state.game_started:
-        if st.button("Mulai Game Baru", key="start_game_btn", help="Klik untuk memulai petualangan!"):
-            reset_game()
-            st.rerun() # Penting untuk me-restart loop game
-    elif st.session_state.game_over:
-        st.error(f"GAME OVER! Skor Anda: {st.session_state.score}")
-        if st.button("Main Lagi?", key="restart_game_btn", help="Coba lagi untuk skor lebih tinggi!"):
-            reset_game()
-            st.rerun()
+mode = st.sidebar.radio("Mode permainan:", GAME_MODES, key="game_mode",
+                        help="Mode browser menjalankan game di perangkat Anda; server hanya menerima skor akhir.")
+
+st.sidebar.text_input("Nama pemain:", key="player_name", max_chars=20, placeholder="Anonim")
+with st.sidebar.expander("Papan Skor", expanded=True):
+    # Dibaca dari cache memori; database hanya disentuh setelah ada skor baru
+    leaderboard = get_leaderboard()
+    top = leaderboard.top(LEADERBOARD_SIZE)
+    if top:
+        st.markdown("\n".join(f"{i}. **{name}** — {score}" for i, (name, score) in enumerate(top, 1)))
     else:
-        if st.button("Lompat!", key="jump_btn", help="Tekan untuk membuat pelari melompat!"):
-            jump()
-            # Tidak perlu st.rerun() di sini, karena game loop akan memanggilnya
-        # Tombol lompat tidak perlu rerun karena game loop akan terus berjalan
-        # dan update_game_state akan dipanggil setiap iterasi
-
-if st.session_state.game_started and not st.session_state.game_over:
-    st.sidebar.markdown(f"**SKOR:** `{st.session_state.score}`")
-    st.sidebar.markdown("Tekan tombol 'Lompat!' atau gunakan spasi (jika bisa diimplementasikan pada browser Anda).") # Spasi mungkin tidak langsung berfungsi di Streamlit
-    
-    # Loop Game Utama
-    with game_placeholder.container():
-        # Update state
-        update_game_state()
+        st.caption("Belum ada skor.")
+    bests = [leaderboard.personal_best(player_name()), leaderboard.pending_best(player_name())]
+    best = max((b for b in bests if b is not None), default=None)
+    st.caption(f"Skor terbaik {player_name()}: {best if best is not None else '-'}")
 
-        # Render Game (Matplotlib)
-        fig, ax = plt.subplots(figsize=(10, 4))
-        ax.set_facecolor(COLOR_BACKGROUND)
-        ax.set_xlim(0, 1)
-        ax.set_ylim(0, 1)
-        ax.axis('off') # Sembunyikan sumbu
-
-        # Gambar Tanah
-        ax.hlines(GROUND_LEVEL, 0, 1, color=COLOR_GROUND, linewidth=20)
-        
-        # Gambar Pelari
-        runner_x = 0.1 # Posisi X pelari tetap
-        runner_y_draw = st.session_state.runner_y + GROUND_LEVEL # Sesuaikan untuk dasar tanah
-        ax.add_patch(plt.Rectangle((runner_x, runner_y_draw), RUNNER_SIZE/2, RUNNER_SIZE, color=COLOR_RUNNER, zorder=3))
-
-        # Gambar Rintangan
-        for obs_x, obs_y, obs_w, obs_h in st.session_state.obstacles:
-            ax.add_patch(plt.Rectangle((obs_x, obs_y + GROUND_LEVEL), obs_w, obs_h, color=COLOR_OBSTACLE, zorder=2))
-        
-        # Tampilkan Skor di dalam game
-        ax.text(0.95, 0.9, f"SKOR: {st.session_state.score}", 
-                horizontalalignment='right', verticalalignment='top', 
-                color=COLOR_TEXT, fontsize=16, 
-                bbox=dict(facecolor='black', alpha=0.5, edgecolor='none', boxstyle='round,pad=0.5'))
-
-        st.pyplot(fig)
-        plt.close(fig) # Penting untuk membebaskan memori
-
-    # Force rerun untuk loop game
-    time.sleep(GAME_SPEED)
-    st.rerun()
+with st.sidebar.expander("Replay"):
+    if st.session_state.get('last_replay'):
+        st.download_button("Unduh replay terakhir", st.session_state.last_replay,
+                           file_name="pixel_runner.replay", mime="application/octet-stream")
+    uploaded = st.file_uploader("Atau unggah file replay", type=["replay"])
+    speed = st.select_slider("Kecepatan putar:", PLAYBACK_SPEEDS, value=1, format_func=lambda s: f"{s}x")
+    replay_data = uploaded.getvalue() if uploaded else st.session_state.get('last_replay')
+    if replay_data and st.button("Putar replay", key="play_replay_btn"):
+        try:
+            start_playback(replay_data, speed)
+        except ValueError as e:
+            st.error(f"Replay tidak bisa dibaca: {e}")
+
+if st.session_state.get('playback'):
+    player, _, recorded_score = st.session_state.playback
+    if not player.state.game_over:
+        with game_placeholder.container():
+            playback_view()
+    else:
+        with game_placeholder.container():
+            st.image(render_frame(player.state))
+        if player.state.score == recorded_score and not player.mismatch:
+            st.success(f"Replay selesai: skor {player.state.score} cocok dengan rekaman.")
+        else:
+            st.warning(f"Replay selesai dengan skor {player.state.score}, rekaman menyebut {recorded_score}.")
+        st.button("Tutup replay", on_click=stop_playback)
 
-elif not st.session_state.game_started:
+elif mode == GAME_MODES[0]:
+    # Game berjalan di browser: tidak ada rerun per frame, hanya satu kiriman saat game selesai
+    if 'browser_seed' not in st.session_state:
+        st.session_state.browser_seed = random.getrandbits(32)
+        st.session_state.browser_best = 0
+        st.session_state.browser_last = None
+        st.session_state.browser_pending = None
     with game_placeholder.container():
-        st.info("Klik 'Mulai Game Baru' untuk bermain!")
-        st.image("https://images.unsplash.com/photo-1605379399642-870262d3d051?ixlib=rb-4.0.3&ixid=M3wxMjA3fDB8MHxwaG90by1wYWdlfHx8fGVufDB8fHx8fA%3D%3D&auto=format&fit=crop&w=1770&q=80", 
-                 caption="Siap berlari? Gambar oleh Vova Valuysky di Unsplash", use_column_width=True)
+        runner_game(
+            st.session_state.browser_seed, GAME_CONFIG,
+            {'background': COLOR_BACKGROUND, 'ground': COLOR_GROUND, 'runner': COLOR_RUNNER,
+             'obstacle': COLOR_OBSTACLE, 'text': COLOR_TEXT},
+            key="browser_game", on_change=submit_browser_result,
+        )
+    st.caption("Klik area game lalu tekan Spasi / panah atas (atau klik) untuk melompat.")
+    if st.session_state.browser_pending:
+        validation_status()
+    elif st.session_state.browser_last:
+        score, jump_count, valid = st.session_state.browser_last
+        if valid:
+            st.error(f"GAME OVER! Skor Anda: {score} ({jump_count} lompatan)")
+        else:
+            st.warning("Hasil game terakhir tidak valid (replay tidak cocok dengan skornya), skor tidak dicatat.")
+    st.sidebar.markdown(f"**SKOR TERBAIK:** `{st.session_state.browser_best}`")
+
+else:
+    # Tombol untuk memulai/main lagi; selama game berjalan semuanya ada di fragment game_loop
+    col_buttons = st.columns([1, 1, 1])
+    with col_buttons[1]: # Tengah
+        if not st.session_state.game_started:
+            if st.button("Mulai Game Baru", key="start_game_btn", help="Klik untuk memulai petualangan!"):
+                reset_game()
+                st.rerun() # Penting untuk me-restart loop game
+        elif st.session_state.game.game_over:
+            st.error(f"GAME OVER! Skor Anda: {st.session_state.game.score}")
+            if st.button("Main Lagi?", key="restart_game_btn", help="Coba lagi untuk skor lebih tinggi!"):
+                reset_game()
+                st.rerun()
+
+    st.sidebar.toggle("Autopilot", key="autopilot",
+                      help="Lompatan dipilih otomatis lewat simulasi ke depan (skor tidak masuk papan skor).")
+    if st.session_state.game_started and not st.session_state.game.game_over:
+        st.sidebar.markdown("Tekan tombol 'Lompat!'. Untuk kontrol spasi, pilih mode Browser.")
+
+        # Loop Game Utama: fragment dengan timer, script lain tidak dijalankan ulang per frame
+        with game_placeholder.container():
+            game_loop()
+
+    elif not st.session_state.game_started:
+        with game_placeholder.container():
+            st.info("Klik 'Mulai Game Baru' untuk bermain!")
+            st.image("https://images.unsplash.com/photo-1605379399642-870262d3d051?ixlib=rb-4.0.3&ixid=M3wxMjA3fDB8MHxwaG90by1wYWdlfHx8fGVufDB8fHx8fA%3D%3D&auto=format&fit=crop&w=1770&q=80", 
+                     caption="Siap berlari? Gambar oleh Vova Valuysky di Unsplash", use_column_width=True)
 
 # Footer
 st.markdown("---")
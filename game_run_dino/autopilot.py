@@ -0,0 +1,180 @@
+"""Autopilot Pixel Runner dengan pencarian lookahead di atas `sim.step`.
+
+Gerak rintangan tidak bergantung pada pelari, jadi rintangan diramal sekali
+untuk `horizon` frame ke depan (dari salinan state) dan ramalan itu digeser
+satu frame setiap langkah. Pelari di tanah selalu berada di state yang sama
+(y = tanah, vy = 0), sehingga pilihan "lompat sekarang atau tunggu" bisa
+dihitung dengan pemrograman dinamis mundur per frame: cabang yang menabrak
+langsung dipangkas, lengkung lompatan dihitung sekali per konfigurasi, dan
+tabrakan seluruh horizon diuji sekaligus dengan NumPy.
+
+Menghitung skor maksimal yang bisa dicapai untuk satu set konstanta:
+
+    python autopilot.py --games 8 --gravity 0.09
+"""
+
+import argparse
+import copy
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+
+from sim import DEFAULT_CONFIG, MAX_OBSTACLES, GameState, advance_obstacles, step, swept_hit
+
+HORIZON = 120      # Frame yang diramal ke depan (harus jauh lebih panjang dari satu lompatan)
+FAR_AWAY = 10.0    # Posisi x untuk slot rintangan kosong (tidak pernah bertabrakan)
+
+
+@lru_cache(maxsize=32)
+def _jump_arc(config_items):
+    config = dict(config_items)
+    ground = config['ground_level']
+    y, vy, arc = ground, config['jump_strength'], []
+    while True:
+        y_start = y
+        y += vy
+        vy -= config['gravity']
+        if y <= ground:
+            y, vy = ground, 0.0
+        arc.append((y_start, y))
+        if y == ground:
+            return np.array(arc)
+
+
+def jump_arc(config):
+    """Posisi (y awal, y akhir) pelari per frame untuk satu lompatan dari tanah hingga mendarat."""
+    return _jump_arc(tuple(sorted(config.items())))
+
+
+class Autopilot:
+    """Memutuskan kapan melompat dengan meramal rintangan `horizon` frame ke depan."""
+
+    def __init__(self, config=DEFAULT_CONFIG, horizon=HORIZON):
+        self.config = config
+        self.horizon = horizon
+        self.arc = jump_arc(config)
+        self._shadow = None      # Salinan state yang hanya menggerakkan rintangan
+        self._forecast = deque() # (x awal, x akhir, tinggi) per frame mulai dari self._first
+        self._first = 0
+        self.plan_ms = deque(maxlen=300)
+
+    def _sync(self, state):
+        """Menyelaraskan ramalan dengan frame `state` (ramalan dibangun ulang jika game berganti)."""
+        if (self._shadow is None or self._shadow.seed != state.seed
+                or not self._first <= state.frame_count <= self._first + len(self._forecast)):
+            self._shadow = copy.deepcopy(state)
+            self._forecast.clear()
+            self._first = state.frame_count
+        while self._first < state.frame_count:
+            self._forecast.popleft()
+            self._first += 1
+        while len(self._forecast) < self.horizon:
+            prev, x, heights = advance_obstacles(self._shadow)
+            self._shadow.score += 1
+            self._shadow.frame_count += 1
+            pad = MAX_OBSTACLES - len(x)
+            self._forecast.append((
+                np.pad(prev, (0, pad), constant_values=FAR_AWAY),
+                np.pad(x, (0, pad), constant_values=FAR_AWAY),
+                np.pad(heights, (0, pad)),
+            ))
+
+    def plan(self, state):
+        """Mengembalikan (lompat sekarang?, jumlah frame bertahan terbaik dalam horizon)."""
+        self._sync(state)
+        cfg, horizon, arc = self.config, self.horizon, self.arc
+        ground = cfg['ground_level']
+        prev, x, heights = (np.array(a) for a in zip(*self._forecast))  # (horizon, slot)
+
+        # Tabrakan bila tetap di tanah pada setiap frame
+        ground_hit = swept_hit(prev, x, heights, ground, ground, cfg).any(axis=1)
+
+        # Tabrakan untuk lompatan yang dimulai di setiap frame t: frame t + k memakai arc[k]
+        length = len(arc)
+        frames = np.arange(horizon)[:, None] + np.arange(length)[None, :]
+        inside = frames < horizon
+        idx = np.minimum(frames, horizon - 1)
+        arc_hit = swept_hit(prev[idx], x[idx], heights[idx],
+                            arc[None, :, 0, None], arc[None, :, 1, None], cfg).any(axis=2) & inside
+        first_hit = np.where(arc_hit.any(axis=1), arc_hit.argmax(axis=1), length)
+
+        # Pemrograman dinamis mundur: best[t] = frame bertahan terbaik jika di tanah pada frame t
+        best = [0] * (horizon + 1)
+        best[horizon] = horizon
+        jump_first = False
+        for t in range(horizon - 1, -1, -1):
+            wait = t if ground_hit[t] else best[t + 1]
+            if first_hit[t] < length:
+                leap = t + int(first_hit[t])  # Cabang dipangkas di frame tabrakan
+            else:
+                leap = best[min(t + length, horizon)]
+            best[t] = max(wait, leap)
+            jump_first = leap > wait
+        return jump_first, best[0]
+
+    def decide(self, state):
+        """True jika pelari sebaiknya melompat pada frame ini (hanya bermakna saat di tanah)."""
+        start = time.perf_counter()
+        if state.on_ground:
+            jump, _ = self.plan(state)
+        else:
+            self._sync(state)  # Tetap geser ramalan agar frame berikutnya murah
+            jump = False
+        self.plan_ms.append((time.perf_counter() - start) * 1000)
+        return jump
+
+
+# --- Skor Maksimal (Headless) ---
+
+def autopilot_score(seed, config=DEFAULT_CONFIG, max_frames=5000, horizon=HORIZON):
+    """Memainkan satu game dengan autopilot; mengembalikan (skor, waktu rencana per frame dalam ms)."""
+    state = GameState(seed, config)
+    pilot = Autopilot(config, horizon)
+    while not state.game_over and state.frame_count < max_frames:
+        step(state, jump=pilot.decide(state))
+    return state.score, list(pilot.plan_ms)
+
+
+def _score_job(job):
+    seed, config, max_frames, horizon = job
+    return autopilot_score(seed, config, max_frames, horizon)
+
+
+def max_score_report(config=DEFAULT_CONFIG, games=8, max_frames=5000, seed=0, workers=None, horizon=HORIZON):
+    """Skor autopilot untuk `games` seed; mengembalikan (array skor, array waktu rencana ms)."""
+    jobs = [(seed + i, config, max_frames, horizon) for i in range(games)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_score_job, jobs))
+    scores = np.array([score for score, _ in results])
+    plan_ms = np.concatenate([times for _, times in results])
+    return scores, plan_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Skor maksimal autopilot Pixel Runner per set konstanta.")
+    parser.add_argument("--games", type=int, default=8)
+    parser.add_argument("--max-frames", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="Jumlah proses (default: semua core)")
+    parser.add_argument("--horizon", type=int, default=HORIZON)
+    parser.add_argument("--spawn-rate", type=float, default=DEFAULT_CONFIG['spawn_rate'])
+    parser.add_argument("--gravity", type=float, default=DEFAULT_CONFIG['gravity'])
+    parser.add_argument("--jump-strength", type=float, default=DEFAULT_CONFIG['jump_strength'])
+    args = parser.parse_args()
+
+    config = dict(DEFAULT_CONFIG, spawn_rate=args.spawn_rate, gravity=args.gravity,
+                  jump_strength=args.jump_strength)
+    scores, plan_ms = max_score_report(config, args.games, args.max_frames, args.seed, args.workers, args.horizon)
+    capped = (scores >= args.max_frames).mean()
+    p50, p99 = np.percentile(plan_ms, (50, 99))
+    print(f"Skor autopilot ({args.games} game): maks {scores.max()}, median {np.median(scores):.0f}, "
+          f"min {scores.min()} ({capped:.0%} mencapai batas {args.max_frames} frame)")
+    print(f"Waktu rencana per frame: p50 {p50:.2f} ms, p99 {p99:.2f} ms "
+          f"(anggaran frame {config['game_speed'] * 1000:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
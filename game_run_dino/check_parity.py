@@ -0,0 +1,147 @@
+"""Cek paritas fisika browser (game_component/index.html) dengan `sim.step`.
+
+Validasi replay hanya sah jika game di browser dan `sim.py` menghasilkan run
+yang identik bit demi bit untuk seed + log lompatan yang sama: urutan
+panggilan mulberry32, munculnya rintangan, dan uji tabrakan harus sama
+persis. Skrip ini menjalankan script game dari index.html di Node (DOM
+diganti objek kosong), memutar seed dan log lompatan yang sama di kedua
+sisi, lalu membandingkan state setiap frame (y, vy, rintangan, skor):
+
+    python check_parity.py --games 8 --max-frames 3000
+
+Keluar dengan kode 1 pada frame pertama yang berbeda.
+"""
+
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+from autopilot import Autopilot
+from sim import DEFAULT_CONFIG, GameState, Mulberry32, step
+
+COMPONENT_HTML = Path(__file__).parent / "game_component" / "index.html"
+RANDOM_PRESS_RATE = 0.05  # Peluang tekan acak per frame (termasuk saat di udara, yang diabaikan)
+
+# Menjalankan script komponen di vm Node dengan DOM tiruan, lalu menggerakkan
+# newGame()/step() langsung: satu frame per step(), jumpQueued dari log.
+NODE_DRIVER = r"""
+const fs = require("fs"), vm = require("vm");
+const job = JSON.parse(fs.readFileSync(0, "utf8"));
+const html = fs.readFileSync(job.html, "utf8");
+const source = html.slice(html.indexOf("<script>") + 8, html.lastIndexOf("</script>"));
+const noop = function () {};
+const ctx2d = new Proxy({}, { get: function () { return noop; }, set: function () { return true; } });
+const canvas = { width: 800, height: 300, getContext: function () { return ctx2d; }, focus: noop,
+                 addEventListener: noop, getBoundingClientRect: function () { return { height: 300 }; } };
+const sandbox = {
+  document: { getElementById: function () { return canvas; }, addEventListener: noop },
+  window: { addEventListener: noop, parent: { postMessage: noop } },
+  performance: { now: function () { return 0; } },
+  requestAnimationFrame: noop, Math: Math, Object: Object, Infinity: Infinity,
+};
+vm.createContext(sandbox);
+vm.runInContext(source, sandbox);
+sandbox.job = job;
+const traces = vm.runInContext(`
+  cfg = job.config;
+  job.runs.map(function (run) {
+    seed = run.seed;
+    newGame();
+    const presses = new Set(run.presses), trace = [];
+    while (state === "running" && game.frame < job.max_frames) {
+      jumpQueued = presses.has(game.frame);
+      step();
+      trace.push([game.y, game.vy, game.score, game.frame, state === "over",
+                  game.obstacles.map(function (o) { return [o.x, o.h]; })]);
+    }
+    return trace;
+  });
+`, sandbox);
+process.stdout.write(JSON.stringify(traces));
+"""
+
+
+def python_run(seed, presses, max_frames, config=DEFAULT_CONFIG):
+    """Memutar log tekan tombol di `sim.step`; mengembalikan trace per frame."""
+    state = GameState(seed, config)
+    trace = []
+    while not state.game_over and state.frame_count < max_frames:
+        step(state, jump=state.frame_count in presses)
+        trace.append([state.runner_y, state.runner_vy, state.score, state.frame_count, state.game_over,
+                      [[x, h] for x, _, _, h in state.obstacle_boxes()]])
+    return trace
+
+
+def autopilot_presses(seed, max_frames, config=DEFAULT_CONFIG):
+    """Log tekan tombol dari `Autopilot`: run panjang yang melewati seluruh kenaikan kecepatan."""
+    state = GameState(seed, config)
+    pilot = Autopilot(config)
+    presses = []
+    while not state.game_over and state.frame_count < max_frames:
+        press = pilot.decide(state)
+        if press:
+            presses.append(state.frame_count)
+        step(state, jump=press)
+    return presses
+
+
+def random_presses(seed, max_frames):
+    """Log tekan tombol acak (deterministik per seed), termasuk tekan di udara yang harus diabaikan."""
+    rng = Mulberry32(seed ^ 0x9E3779B9)
+    return [frame for frame in range(max_frames) if rng.random() < RANDOM_PRESS_RATE]
+
+
+def node_runs(runs, max_frames, config=DEFAULT_CONFIG):
+    """Menjalankan semua run di script browser lewat Node; mengembalikan trace per run."""
+    job = {"html": str(COMPONENT_HTML), "config": config, "max_frames": max_frames,
+           "runs": [{"seed": seed, "presses": presses} for seed, presses in runs]}
+    result = subprocess.run(["node", "-e", NODE_DRIVER], input=json.dumps(job),
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def first_difference(expected, actual):
+    """Indeks frame pertama yang berbeda di dua trace (panjang berbeda juga dihitung), atau None."""
+    for frame, (a, b) in enumerate(zip(expected, actual)):
+        if a != b:
+            return frame
+    if len(expected) != len(actual):
+        return min(len(expected), len(actual))
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Membandingkan fisika game browser dengan sim.py per frame.")
+    parser.add_argument("--games", type=int, default=8, help="Jumlah seed (masing-masing dua log lompatan)")
+    parser.add_argument("--max-frames", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=0, help="Seed pertama")
+    args = parser.parse_args()
+
+    if shutil.which("node") is None:
+        sys.exit("node tidak ditemukan; cek paritas butuh Node.js")
+
+    runs = []
+    for seed in range(args.seed, args.seed + args.games):
+        runs.append((seed, autopilot_presses(seed, args.max_frames)))
+        runs.append((seed, random_presses(seed, args.max_frames)))
+    browser = node_runs(runs, args.max_frames)
+
+    failures = frames = 0
+    for (seed, presses), js_trace in zip(runs, browser):
+        trace = python_run(seed, set(presses), args.max_frames)
+        frames += len(trace)
+        frame = first_difference(trace, js_trace)
+        if frame is not None:
+            failures += 1
+            print(f"seed {seed}: berbeda di frame {frame}")
+            print(f"  python : {trace[frame] if frame < len(trace) else 'selesai'}")
+            print(f"  browser: {js_trace[frame] if frame < len(js_trace) else 'selesai'}")
+    print(f"{len(runs)} run, {frames:,} frame dibandingkan, {failures} berbeda")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
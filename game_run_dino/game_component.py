@@ -0,0 +1,32 @@
+"""Komponen Streamlit yang menjalankan Pixel Runner sepenuhnya di browser.
+
+Fisika, input keyboard (spasi / panah atas / klik), dan render kanvas berjalan
+di sisi klien. Server hanya mengirim konfigurasi dan seed, lalu menerima satu
+hasil per game: {"seed", "score", "frames", "jumps"} dengan `jumps` berupa
+selisih frame antar lompatan.
+"""
+
+import os
+
+import streamlit.components.v1 as components
+
+_game_component = components.declare_component(
+    "runner_game",
+    path=os.path.join(os.path.dirname(os.path.abspath(__file__)), "game_component"),
+)
+
+
+def runner_game(seed, config, colors, key=None, on_change=None):
+    """Menampilkan game di browser; hasil game terakhir bisa dibaca dari st.session_state[key]."""
+    return _game_component(seed=seed, config=config, colors=colors, key=key, on_change=on_change, default=None)
+
+
+def game_result(value):
+    """Mengubah nilai komponen menjadi (seed, skor, jumlah frame, frame lompatan absolut)."""
+    if not value:
+        return None
+    frames, total = [], 0
+    for delta in value["jumps"]:
+        total += int(delta)
+        frames.append(total)
+    return int(value["seed"]), int(value["score"]), int(value["frames"]), frames
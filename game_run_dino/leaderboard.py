@@ -0,0 +1,106 @@
+"""Papan skor Pixel Runner bersama di SQLite (mode WAL).
+
+Satu objek `Leaderboard` (satu koneksi) dipakai bersama oleh semua sesi di
+proses server. Skor baru ditampung lalu ditulis bersamaan dengan
+`executemany`, dan hasil baca (top-N, skor terbaik pemain) disimpan di
+memori sampai ada insert baru, sehingga loop game tidak pernah menunggu
+query database.
+"""
+
+import atexit
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+DB_PATH = os.path.join(DATA_DIR, "leaderboard.db")
+BATCH_SIZE = 16       # Tulis ke database jika antrean mencapai jumlah ini
+FLUSH_INTERVAL = 2.0  # ... atau jika skor tertua di antrean sudah menunggu selama ini (detik)
+BEST_CACHE_SIZE = 1024  # Jumlah pemain yang skor terbaiknya disimpan di cache (LRU)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    replay BLOB,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC);
+CREATE INDEX IF NOT EXISTS scores_by_player ON scores (player, score DESC);
+"""
+
+
+class Leaderboard:
+    """Koneksi SQLite bersama dengan antrean insert dan cache baca per versi data."""
+
+    def __init__(self, path=DB_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._pending = []
+        self._pending_since = None
+        self._top = {}   # n -> [(pemain, skor), ...]
+        self._best = OrderedDict()  # pemain -> skor terbaik (atau None), LRU
+        atexit.register(self.flush)
+
+    def submit(self, player, score, replay=None):
+        """Menambahkan skor ke antrean; ditulis per batch (lihat BATCH_SIZE / FLUSH_INTERVAL)."""
+        with self._lock:
+            if not self._pending:
+                self._pending_since = time.monotonic()
+            self._pending.append((player, int(score), replay, time.time()))
+        self._flush_if_due()
+
+    def _flush_if_due(self):
+        with self._lock:
+            due = bool(self._pending) and (len(self._pending) >= BATCH_SIZE
+                                           or time.monotonic() - self._pending_since >= FLUSH_INTERVAL)
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Menulis seluruh antrean dalam satu transaksi lalu mengosongkan cache baca."""
+        with self._lock:
+            if not self._pending:
+                return
+            rows, self._pending = self._pending, []
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO scores (player, score, replay, created) VALUES (?, ?, ?, ?)", rows)
+            self._top.clear()
+            self._best.clear()
+
+    def top(self, n=10):
+        """Daftar (pemain, skor) tertinggi; dibaca dari cache kecuali ada insert baru."""
+        self._flush_if_due()
+        with self._lock:
+            rows = self._top.get(n)
+            if rows is None:
+                rows = self._top[n] = self._conn.execute(
+                    "SELECT player, score FROM scores ORDER BY score DESC, id LIMIT ?", (n,)).fetchall()
+            return rows
+
+    def personal_best(self, player):
+        """Skor terbaik pemain (None jika belum pernah bermain), dari cache yang sama."""
+        self._flush_if_due()
+        with self._lock:
+            if player in self._best:
+                self._best.move_to_end(player)
+                return self._best[player]
+            row = self._conn.execute(
+                "SELECT MAX(score) FROM scores WHERE player = ?", (player,)).fetchone()
+            self._best[player] = row[0]
+            if len(self._best) > BEST_CACHE_SIZE:
+                self._best.popitem(last=False)
+            return row[0]
+
+    def pending_best(self, player):
+        """Skor terbaik pemain yang masih di antrean (belum ditulis)."""
+        with self._lock:
+            return max((score for name, score, _, _ in self._pending if name == player), default=None)
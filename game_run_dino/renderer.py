@@ -0,0 +1,111 @@
+"""Renderer framebuffer NumPy untuk Pixel Runner.
+
+Setiap frame digambar ke satu buffer RGB yang dialokasikan sekali. Langit,
+tanah, pelari, rintangan, dan kotak skor disalin dari sprite yang sudah
+disiapkan di awal, sehingga per frame hanya ada beberapa operasi slicing
+NumPy dan satu encoding gambar.
+"""
+
+import io
+
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+# Ukuran kanvas sama dengan figure Matplotlib lama (10x4 inci pada 100 dpi)
+WIDTH = 1000
+HEIGHT = 400
+GROUND_THICKNESS = 28  # Setara linewidth=20 pt pada 100 dpi
+SCORE_FONT_SIZE = 22
+SCORE_PADDING = 10
+
+
+def _rgb(color):
+    return np.array(ImageColor.getrgb(color), dtype=np.uint8)
+
+
+def _to_px_x(x):
+    return int(round(x * WIDTH))
+
+
+def _to_px_y(y):
+    """Koordinat dunia (0 di bawah, 1 di atas) ke baris piksel (0 di atas)."""
+    return int(round((1 - y) * HEIGHT))
+
+
+class FrameRenderer:
+    """Menggambar state game ke buffer RGB (HEIGHT, WIDTH, 3) yang dipakai ulang."""
+
+    def __init__(self, background, ground, runner, obstacle, text, ground_level):
+        self.buffer = np.empty((HEIGHT, WIDTH, 3), dtype=np.uint8)
+        self.runner_color = _rgb(runner)
+        self.obstacle_color = _rgb(obstacle)
+
+        # Latar (langit + tanah) digambar sekali lalu disalin ke buffer tiap frame
+        self.background = np.empty_like(self.buffer)
+        self.background[:] = _rgb(background)
+        ground_row = _to_px_y(ground_level)
+        half = GROUND_THICKNESS // 2
+        self.background[ground_row - half:ground_row + half] = _rgb(ground)
+
+        # Glyph skor: mask alpha per karakter, dirender sekali dengan PIL
+        font = ImageFont.load_default(size=SCORE_FONT_SIZE)
+        self.text_color = _rgb(text)
+        self.glyph_height = font.getbbox("SKOR0123456789")[3]
+        self.glyphs = {ch: self._glyph(font, ch, self.glyph_height) for ch in "SKOR: 0123456789"}
+
+    @staticmethod
+    def _glyph(font, ch, height):
+        width = int(round(font.getlength(ch))) or 1
+        image = Image.new("L", (width, height), 0)
+        ImageDraw.Draw(image).text((0, 0), ch, font=font, fill=255)
+        return np.asarray(image, dtype=np.float32)[:, :, None] / 255
+
+    def _fill_rect(self, x, y, w, h, color):
+        """Mengisi persegi panjang dalam koordinat dunia (x, y = sudut kiri bawah)."""
+        left, right = max(_to_px_x(x), 0), min(_to_px_x(x + w), WIDTH)
+        top, bottom = max(_to_px_y(y + h), 0), min(_to_px_y(y), HEIGHT)
+        if left < right and top < bottom:
+            self.buffer[top:bottom, left:right] = color
+
+    def _draw_score(self, score):
+        """Teks skor di pojok kanan atas di atas kotak hitam transparan (alpha 0.5)."""
+        glyphs = [self.glyphs[ch] for ch in f"SKOR: {score}"]
+        text_width = sum(g.shape[1] for g in glyphs)
+        right, top = _to_px_x(0.95), _to_px_y(0.9)
+        box = self.buffer[top:top + self.glyph_height + 2 * SCORE_PADDING,
+                          right - text_width - 2 * SCORE_PADDING:right]
+        box >>= 1  # Campur dengan hitam alpha 0.5
+        x = right - text_width - SCORE_PADDING
+        y = top + SCORE_PADDING
+        for glyph in glyphs:
+            h, w = glyph.shape[:2]
+            region = self.buffer[y:y + h, x:x + w]
+            region[:] = region * (1 - glyph) + self.text_color * glyph
+            x += w
+
+    def render(self, runner_x, runner_y, runner_w, runner_h, obstacles, score):
+        """Menggambar satu frame dan mengembalikan buffer (dipakai ulang di frame berikutnya).
+
+        `obstacles` adalah iterable (x, y, w, h) dalam koordinat dunia.
+        """
+        np.copyto(self.buffer, self.background)
+        for obs_x, obs_y, obs_w, obs_h in obstacles:
+            self._fill_rect(obs_x, obs_y, obs_w, obs_h, self.obstacle_color)
+        self._fill_rect(runner_x, runner_y, runner_w, runner_h, self.runner_color)
+        self._draw_score(score)
+        return self.buffer
+
+
+def encode_frame(buffer, fmt="JPEG", quality=80):
+    """Mengubah buffer RGB menjadi bytes gambar siap kirim ke st.image.
+
+    JPEG dengan kualitas sedang jauh lebih cepat dari PNG untuk ukuran ini;
+    gunakan fmt="PNG" (compress_level=1) jika butuh warna persis.
+    """
+    out = io.BytesIO()
+    image = Image.frombuffer("RGB", (WIDTH, HEIGHT), buffer, "raw", "RGB", 0, 1)
+    if fmt == "PNG":
+        image.save(out, format="PNG", compress_level=1)
+    else:
+        image.save(out, format="JPEG", quality=quality)
+    return out.getvalue()
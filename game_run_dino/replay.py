@@ -0,0 +1,117 @@
+"""Rekaman replay Pixel Runner: seed + frame lompatan dalam format biner ringkas.
+
+Format (little-endian):
+
+    b"PR" | versi (1 byte) | seed (uint32) | skor (varint) | jumlah lompatan (varint)
+    | selisih frame antar lompatan (varint)
+
+Selisih antar lompatan biasanya di bawah 128 frame sehingga setiap lompatan
+hanya memakan satu byte. Karena simulasi deterministik per seed, replay bisa
+diputar ulang persis dan skor yang dikirim bisa diverifikasi ulang di server.
+"""
+
+import struct
+from concurrent.futures import ThreadPoolExecutor
+
+from sim import DEFAULT_CONFIG, GameState, step
+
+MAGIC = b"PR"
+VERSION = 1
+MAX_REPLAY_FRAMES = 200_000  # Batas simulasi validator (sekitar 4,5 jam permainan)
+
+
+# --- Format Biner ---
+
+def _write_varint(out, value):
+    if value < 0:
+        raise ValueError(f"Varint tidak boleh negatif: {value}")
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos):
+    value = shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("Replay terpotong")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def encode_replay(seed, jumps, score):
+    """Mengemas (seed, frame lompatan absolut yang urut, skor) menjadi bytes."""
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+    out += struct.pack("<I", seed & 0xFFFFFFFF)
+    _write_varint(out, score)
+    _write_varint(out, len(jumps))
+    previous = 0
+    for frame in jumps:
+        _write_varint(out, frame - previous)
+        previous = frame
+    return bytes(out)
+
+
+def decode_replay(data):
+    """Membuka bytes replay menjadi (seed, frame lompatan absolut, skor); ValueError jika rusak."""
+    if len(data) < 7 or data[:2] != MAGIC:
+        raise ValueError("Bukan file replay Pixel Runner")
+    if data[2] != VERSION:
+        raise ValueError(f"Versi replay {data[2]} tidak didukung")
+    (seed,) = struct.unpack_from("<I", data, 3)
+    score, pos = _read_varint(data, 7)
+    count, pos = _read_varint(data, pos)
+    jumps, frame = [], 0
+    for _ in range(count):
+        delta, pos = _read_varint(data, pos)
+        frame += delta
+        jumps.append(frame)
+    return seed, jumps, score
+
+
+# --- Pemutaran ---
+
+class ReplayPlayer:
+    """Memutar ulang replay langkah demi langkah; `advance(n)` untuk fast-forward."""
+
+    def __init__(self, seed, jumps, config=DEFAULT_CONFIG):
+        self.state = GameState(seed, config)
+        self.jumps = set(jumps)
+        self.mismatch = False  # True jika lompatan terekam tidak bisa dilakukan saat diputar ulang
+
+    def advance(self, steps=1):
+        """Menjalankan hingga `steps` frame (berhenti saat game selesai); hanya state akhir yang perlu dirender."""
+        state = self.state
+        for _ in range(steps):
+            if state.game_over:
+                break
+            wanted = state.frame_count in self.jumps
+            if step(state, jump=wanted) != wanted:
+                self.mismatch = True
+        return state
+
+
+def validate_replay(data, claimed_score, config=DEFAULT_CONFIG):
+    """Mensimulasikan ulang replay; mengembalikan (valid, skor hasil simulasi)."""
+    seed, jumps, score = decode_replay(data)
+    if score != claimed_score or claimed_score > MAX_REPLAY_FRAMES:
+        return False, None
+    player = ReplayPlayer(seed, jumps, config)
+    state = player.advance(claimed_score)
+    valid = state.game_over and state.score == claimed_score and not player.mismatch
+    return valid, state.score
+
+
+# Validator berjalan di thread latar agar rerun Streamlit tidak menunggu simulasi
+_validator = ThreadPoolExecutor(max_workers=2, thread_name_prefix="replay-validator")
+
+
+def submit_validation(data, claimed_score, config=DEFAULT_CONFIG):
+    """Menjadwalkan `validate_replay` di thread latar; mengembalikan Future."""
+    return _validator.submit(validate_replay, data, claimed_score, config)
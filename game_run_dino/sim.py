@@ -0,0 +1,321 @@
+"""Inti simulasi Pixel Runner tanpa Streamlit.
+
+`GameState` menyimpan seluruh state satu game beserta RNG ber-seed miliknya,
+dan `step` menjalankan satu frame fisika (lompat, gravitasi, rintangan,
+tabrakan, skor). RNG memakai algoritma mulberry32 yang sama dengan game di
+browser, sehingga seed + input yang sama menghasilkan run yang sama.
+
+Rintangan disimpan dalam ring buffer array NumPy berkapasitas tetap,
+kecepatannya naik mengikuti skor, dan tabrakan diuji secara swept
+(sepanjang gerakan satu frame) sehingga tidak ada tumbukan yang terlewat
+pada kecepatan berapa pun.
+
+`BatchSim` menjalankan ribuan game independen sekaligus dengan array NumPy
+untuk menyetel konstanta terhadap sebaran waktu bertahan:
+
+    python sim.py --games 5000 --gravity 0.09
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+# --- Konfigurasi Game ---
+GROUND_LEVEL = 0.1  # Posisi Y tanah
+RUNNER_SIZE = 0.5   # Ukuran pelari (tinggi)
+OBSTACLE_HEIGHT_MIN = 0.3
+OBSTACLE_HEIGHT_MAX = 0.8
+OBSTACLE_WIDTH = 0.3
+JUMP_STRENGTH = 0.8 # Kekuatan lompatan awal
+GRAVITY = 0.08      # Kekuatan gravitasi
+GAME_SPEED = 0.08   # Kecepatan game (detik per frame)
+OBSTACLE_SPAWN_RATE = 0.02 # Probabilitas rintangan muncul setiap frame
+OBSTACLE_SPEED = 0.1 # Jarak gerak rintangan ke kiri per frame (awal)
+SPEED_RAMP = 0.0001  # Tambahan kecepatan rintangan per poin skor
+MAX_OBSTACLE_SPEED = 0.25 # Batas atas kecepatan rintangan
+RUNNER_X = 0.1      # Posisi X pelari (tetap)
+MAX_OBSTACLES = 2   # Rintangan aktif maksimal di layar
+OBSTACLE_CAPACITY = 4 # Kapasitas ring buffer rintangan
+SPAWN_GAP = 0.7     # Rintangan baru hanya jika rintangan terakhir sudah melewati x ini
+
+# Konfigurasi default; juga dikirim ke game di browser (fisika harus sama)
+DEFAULT_CONFIG = {
+    'ground_level': GROUND_LEVEL, 'runner_x': RUNNER_X, 'runner_size': RUNNER_SIZE,
+    'obstacle_height_min': OBSTACLE_HEIGHT_MIN, 'obstacle_height_max': OBSTACLE_HEIGHT_MAX,
+    'obstacle_width': OBSTACLE_WIDTH, 'obstacle_speed': OBSTACLE_SPEED,
+    'speed_ramp': SPEED_RAMP, 'max_obstacle_speed': MAX_OBSTACLE_SPEED,
+    'jump_strength': JUMP_STRENGTH, 'gravity': GRAVITY, 'game_speed': GAME_SPEED,
+    'spawn_rate': OBSTACLE_SPAWN_RATE,
+}
+
+
+# --- RNG ---
+
+class Mulberry32:
+    """PRNG 32-bit yang identik dengan mulberry32 di komponen browser."""
+
+    def __init__(self, seed):
+        self.state = seed & 0xFFFFFFFF
+
+    def random(self):
+        self.state = a = (self.state + 0x6D2B79F5) & 0xFFFFFFFF
+        t = ((a ^ (a >> 15)) * (a | 1)) & 0xFFFFFFFF
+        t = ((t + (((t ^ (t >> 7)) * (t | 61)) & 0xFFFFFFFF)) & 0xFFFFFFFF) ^ t
+        return ((t ^ (t >> 14)) & 0xFFFFFFFF) / 4294967296
+
+    def uniform(self, a, b):
+        return a + (b - a) * self.random()
+
+
+# --- Fisika Bersama ---
+
+def obstacle_speed(config, score):
+    """Kecepatan rintangan per frame: naik linear dengan skor hingga batas atas."""
+    return min(config['obstacle_speed'] + config['speed_ramp'] * score, config['max_obstacle_speed'])
+
+
+def swept_hit(prev_x, x, heights, y_start, y_end, config):
+    """Uji tabrakan swept-AABB selama satu frame (bisa untuk array, dengan broadcasting).
+
+    Rintangan bergerak dari `prev_x` ke `x` dan pelari dari `y_start` ke `y_end`;
+    gerakan dianggap linear dalam t di [0, 1]. Tabrakan terjadi jika interval
+    tumpang-tindih sumbu x dan sumbu y beririsan di dalam frame. Untuk rintangan
+    yang tidak bergerak uji ini sama dengan AABB biasa di akhir frame.
+    """
+    ground, size = config['ground_level'], config['runner_size']
+    width, x_min = config['obstacle_width'], config['runner_x']
+    x_max = x_min + size / 2
+
+    # Sumbu x: x(t) = prev_x - dx * t
+    dx = prev_x - x
+    moving_x = dx > 0
+    safe_dx = np.where(moving_x, dx, 1.0)
+    static_x = (x_max > x) & (x_min < x + width)
+    tx_enter = np.where(moving_x, (prev_x - x_max) / safe_dx, np.where(static_x, -np.inf, np.inf))
+    tx_exit = np.where(moving_x, (prev_x + width - x_min) / safe_dx, np.inf)
+
+    # Sumbu y: y(t) = y_start + dy * t terhadap rintangan [ground, ground + h]
+    dy = y_end - y_start
+    moving_y = dy != 0
+    safe_dy = np.where(moving_y, dy, 1.0)
+    t_low = (ground - size - y_start) / safe_dy   # Saat bawah rintangan tersentuh dari atas/bawah
+    t_high = (ground + heights - y_start) / safe_dy
+    static_y = (y_start + size > ground) & (y_start < ground + heights)
+    ty_enter = np.where(moving_y, np.minimum(t_low, t_high), np.where(static_y, -np.inf, np.inf))
+    ty_exit = np.where(moving_y, np.maximum(t_low, t_high), np.inf)
+
+    enter = np.maximum(np.maximum(tx_enter, ty_enter), 0.0)
+    exit_ = np.minimum(np.minimum(tx_exit, ty_exit), 1.0)
+    return enter < exit_
+
+
+# --- Simulasi Satu Game ---
+
+class GameState:
+    """State satu game: pelari, ring buffer rintangan (x, tinggi), skor, dan RNG-nya.
+
+    Rintangan muncul di kanan dan bergerak dengan kecepatan sama, sehingga
+    urutan ring (dari `head`) selalu urut dari kiri ke kanan: rintangan yang
+    keluar layar selalu di depan, rintangan terbaru selalu di belakang.
+    """
+
+    def __init__(self, seed, config=DEFAULT_CONFIG):
+        self.config = config
+        self.seed = seed
+        self.rng = Mulberry32(seed)
+        self.runner_y = config['ground_level']
+        self.runner_vy = 0.0
+        self.obs_x = np.zeros(OBSTACLE_CAPACITY)
+        self.obs_h = np.zeros(OBSTACLE_CAPACITY)
+        self.head = 0
+        self.count = 0
+        self.score = 0
+        self.frame_count = 0
+        self.game_over = False
+
+    @property
+    def on_ground(self):
+        return self.runner_y == self.config['ground_level']
+
+    def live(self):
+        """Indeks slot rintangan aktif dalam urutan kiri ke kanan."""
+        return (self.head + np.arange(self.count)) % OBSTACLE_CAPACITY
+
+    def obstacle_boxes(self):
+        """Rintangan aktif sebagai daftar (x, y, w, h) untuk renderer."""
+        ground, width = self.config['ground_level'], self.config['obstacle_width']
+        return [(x, ground, width, h) for x, h in zip(self.obs_x[self.live()].tolist(),
+                                                      self.obs_h[self.live()].tolist())]
+
+
+def advance_obstacles(state):
+    """Menggerakkan, membuang, dan memunculkan rintangan untuk satu frame.
+
+    Tidak bergantung pada pelari, sehingga juga dipakai autopilot untuk
+    meramal rintangan. Mengembalikan (x awal, x akhir, tinggi) rintangan aktif
+    untuk uji tabrakan frame ini (rintangan baru belum bergerak).
+    """
+    cfg = state.config
+    # Rintangan bergerak ke kiri (vektor); yang keluar layar selalu di depan ring
+    live = state.live()
+    prev_x = state.obs_x[live]
+    state.obs_x[live] = prev_x - obstacle_speed(cfg, state.score)
+    gone = int((state.obs_x[live] <= -cfg['obstacle_width']).sum())
+    state.head = (state.head + gone) % OBSTACLE_CAPACITY
+    state.count -= gone
+
+    # Rintangan baru di belakang ring
+    if state.rng.random() < cfg['spawn_rate'] and state.count < MAX_OBSTACLES:
+        last = (state.head + state.count - 1) % OBSTACLE_CAPACITY
+        if state.count == 0 or state.obs_x[last] < SPAWN_GAP:
+            slot = (state.head + state.count) % OBSTACLE_CAPACITY
+            state.obs_x[slot] = 1.0
+            state.obs_h[slot] = state.rng.uniform(cfg['obstacle_height_min'], cfg['obstacle_height_max'])
+            state.count += 1
+
+    live = state.live()
+    prev = np.concatenate([prev_x[gone:], state.obs_x[live[len(prev_x) - gone:]]])
+    return prev, state.obs_x[live], state.obs_h[live]
+
+
+def step(state, jump=False):
+    """Menjalankan satu frame. `jump` berlaku hanya jika pelari di tanah (aturan jump()).
+
+    Mengembalikan True jika lompatan benar-benar dilakukan.
+    """
+    if state.game_over:
+        return False
+    cfg = state.config
+    ground = cfg['ground_level']
+    jumped = jump and state.on_ground
+    if jumped:
+        state.runner_vy = cfg['jump_strength']
+
+    # Pelari (lompat & gravitasi)
+    y_start = state.runner_y
+    state.runner_y += state.runner_vy
+    state.runner_vy -= cfg['gravity']
+    if state.runner_y <= ground:
+        state.runner_y = ground
+        state.runner_vy = 0.0
+
+    # Tabrakan swept untuk semua rintangan sekaligus
+    prev, x, heights = advance_obstacles(state)
+    if swept_hit(prev, x, heights, y_start, state.runner_y, cfg).any():
+        state.game_over = True
+
+    state.score += 1
+    state.frame_count += 1
+    return jumped
+
+
+# --- Simulasi Batch ---
+
+def reflex_policy(trigger_distance=0.5):
+    """Kebijakan sederhana: lompat saat rintangan terdekat sudah dalam jarak tertentu."""
+    def policy(sim):
+        ahead = sim.active & (sim.obs_x + sim.config['obstacle_width'] > sim.config['runner_x'])
+        gap = np.where(ahead, sim.obs_x - sim.config['runner_x'], np.inf).min(axis=1)
+        return gap < trigger_distance
+    return policy
+
+
+class BatchSim:
+    """Ribuan game independen dalam array NumPy (satu baris per game, slot rintangan tetap).
+
+    Aturan sama dengan `step`; RNG memakai np.random.Generator sehingga sebaran
+    hasilnya sama, tetapi urutan acaknya berbeda dengan game di browser.
+    """
+
+    def __init__(self, n, config=DEFAULT_CONFIG, seed=None):
+        self.config = config
+        self.rng = np.random.default_rng(seed)
+        self.y = np.full(n, config['ground_level'])
+        self.vy = np.zeros(n)
+        self.obs_x = np.zeros((n, MAX_OBSTACLES))
+        self.obs_h = np.zeros((n, MAX_OBSTACLES))
+        self.active = np.zeros((n, MAX_OBSTACLES), dtype=bool)
+        self.alive = np.ones(n, dtype=bool)
+        self.frames = np.zeros(n, dtype=np.int64)
+
+    def step(self, jump):
+        """Satu frame untuk semua game yang masih hidup; `jump` mask boolean per game."""
+        cfg, alive = self.config, self.alive
+        ground = cfg['ground_level']
+
+        jump = jump & alive & (self.y == ground)
+        self.vy[jump] = cfg['jump_strength']
+        y_start = self.y
+        self.y = np.where(alive, self.y + self.vy, self.y)
+        self.vy = np.where(alive, self.vy - cfg['gravity'], self.vy)
+        landed = self.y <= ground
+        self.y[landed] = ground
+        self.vy[landed] = 0.0
+
+        prev_x = self.obs_x.copy()
+        speed = np.minimum(cfg['obstacle_speed'] + cfg['speed_ramp'] * self.frames, cfg['max_obstacle_speed'])
+        self.obs_x = np.where(self.active & alive[:, None], self.obs_x - speed[:, None], self.obs_x)
+        self.active &= self.obs_x > -cfg['obstacle_width']
+
+        # Rintangan baru di slot kosong; "rintangan terakhir" adalah yang paling kanan
+        count = self.active.sum(axis=1)
+        last_x = np.where(self.active, self.obs_x, -np.inf).max(axis=1)
+        spawn = (alive & (self.rng.random(len(alive)) < cfg['spawn_rate'])
+                 & (count < MAX_OBSTACLES) & ((count == 0) | (last_x < SPAWN_GAP)))
+        rows = np.nonzero(spawn)[0]
+        slots = (~self.active[rows]).argmax(axis=1)
+        self.obs_x[rows, slots] = 1.0
+        prev_x[rows, slots] = 1.0
+        self.obs_h[rows, slots] = self.rng.uniform(cfg['obstacle_height_min'], cfg['obstacle_height_max'], len(rows))
+        self.active[rows, slots] = True
+
+        hit = (self.active & swept_hit(prev_x, self.obs_x, self.obs_h,
+                                       y_start[:, None], self.y[:, None], cfg)).any(axis=1)
+
+        self.frames[alive] += 1
+        self.alive = alive & ~hit
+
+    def run(self, max_frames, policy=None):
+        """Menjalankan hingga semua game selesai atau `max_frames`; mengembalikan frame bertahan."""
+        policy = policy or reflex_policy()
+        for _ in range(max_frames):
+            if not self.alive.any():
+                break
+            self.step(policy(self))
+        return self.frames
+
+
+def survival_report(games=5000, max_frames=5000, config=DEFAULT_CONFIG, seed=None, policy=None):
+    """Mensimulasikan `games` game; mengembalikan (waktu bertahan dalam detik, frame simulasi/detik)."""
+    sim = BatchSim(games, config, seed)
+    start = time.perf_counter()
+    frames = sim.run(max_frames, policy)
+    elapsed = time.perf_counter() - start
+    return frames * config['game_speed'], frames.sum() / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulasi batch Pixel Runner untuk menyetel konstanta.")
+    parser.add_argument("--games", type=int, default=5000)
+    parser.add_argument("--max-frames", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--spawn-rate", type=float, default=OBSTACLE_SPAWN_RATE)
+    parser.add_argument("--gravity", type=float, default=GRAVITY)
+    parser.add_argument("--jump-strength", type=float, default=JUMP_STRENGTH)
+    parser.add_argument("--trigger", type=float, default=0.5, help="Jarak rintangan saat kebijakan refleks melompat")
+    args = parser.parse_args()
+
+    config = dict(DEFAULT_CONFIG, spawn_rate=args.spawn_rate, gravity=args.gravity,
+                  jump_strength=args.jump_strength)
+    seconds, fps = survival_report(args.games, args.max_frames, config, args.seed,
+                                   reflex_policy(args.trigger))
+    p10, p50, p90 = np.percentile(seconds, (10, 50, 90))
+    capped = (seconds >= args.max_frames * config['game_speed']).mean()
+    print(f"{args.games} game, {fps:,.0f} frame simulasi/detik")
+    print(f"Waktu bertahan: rata-rata {seconds.mean():.1f} s, p10 {p10:.1f} s, p50 {p50:.1f} s, "
+          f"p90 {p90:.1f} s ({capped:.0%} mencapai batas {args.max_frames} frame)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Loop fixed-timestep dan pencatat waktu per fase untuk Pixel Runner.
+
+`FixedTimestep` menghitung berapa langkah simulasi yang harus dijalankan
+berdasarkan waktu nyata yang berlalu, sehingga kecepatan game tidak
+tergantung lama render atau beban server. `FrameStats` menyimpan durasi
+terakhir setiap fase (update, render, encode) dalam jendela bergulir dan
+menghitung p50/p95/p99, ditambah jarak antar tick dan waktu CPU server per
+tick (dasar perkiraan beban CPU per pemain).
+"""
+
+import time
+from collections import deque
+
+import numpy as np
+
+PHASES = ("update", "render", "encode", "tick", "cpu")  # tick: jarak antar tick, cpu: CPU thread per tick
+WINDOW = 300  # Jumlah sampel per fase yang disimpan (sekitar 25 detik pada 12 fps)
+
+
+class FixedTimestep:
+    """Akumulator waktu: setiap `step` detik waktu nyata menghasilkan satu langkah simulasi."""
+
+    def __init__(self, step, max_steps=5):
+        self.step = step
+        self.max_steps = max_steps  # Batas langkah per frame agar tidak terjebak mengejar
+        self.accumulator = 0.0
+        self.last = time.perf_counter()
+
+    def advance(self):
+        """Mengembalikan (jumlah langkah yang harus dijalankan, langkah yang dibuang)."""
+        now = time.perf_counter()
+        self.accumulator += now - self.last
+        self.last = now
+        steps = int(self.accumulator // self.step)
+        self.accumulator -= steps * self.step
+        discarded = max(steps - self.max_steps, 0)
+        return steps - discarded, discarded
+
+
+class FrameStats:
+    """Durasi per fase (ms) dalam jendela bergulir beserta jumlah frame yang tidak dirender."""
+
+    def __init__(self, window=WINDOW):
+        self.samples = {phase: deque(maxlen=window) for phase in PHASES}
+        self.frames = 0
+        self.dropped = 0
+
+    def record(self, phase, ms):
+        self.samples[phase].append(ms)
+
+    def percentiles(self, phase):
+        """(p50, p95, p99) dalam ms, atau None jika belum ada sampel."""
+        samples = self.samples[phase]
+        if not samples:
+            return None
+        return tuple(np.percentile(np.fromiter(samples, dtype=float), (50, 95, 99)))
+
+    def summary(self):
+        """Tabel markdown ringkas untuk panel instrumentasi."""
+        lines = ["| Fase | p50 | p95 | p99 |", "|---|---|---|---|"]
+        for phase in PHASES:
+            stats = self.percentiles(phase)
+            if stats:
+                lines.append(f"| {phase} | " + " | ".join(f"{v:.1f} ms" for v in stats) + " |")
+        return "\n".join(lines)
+
+    def cpu_share(self, step):
+        """Perkiraan bagian satu core yang dipakai satu pemain (p50 CPU per tick / lama tick)."""
+        stats = self.percentiles("cpu")
+        return stats[0] / (step * 1000) if stats else None
@@ -1,6 +1,13 @@
 import streamlit as st
-import numpy as np
-import random
+import time
+
+from bank import draw_puzzle, load_bank
+from board import BoardModel
+from canonical import cached_solve
+from generator import DIFFICULTY_MAPPING, generate_sudoku, holes_for_size
+from grader import grade
+from grid import grid_changes, sudoku_grid
+from solver import solve
 
 # --- Konfigurasi Warna & Gaya ---
 COLOR_BACKGROUND = '#F0F2F6'
@@ -10,135 +17,115 @@ COLOR_GIVEN = '#D3D3D3'   # Light Gray
 COLOR_INPUT = '#FFFFFF'   # White
 COLOR_VALID = '#E0FFFF'   # Azure
 COLOR_INVALID = '#FFB6C1' # Light Pink
+COLOR_CONFLICT = '#FF7F7F' # Salmon Red
 
-# --- Logika Sudoku ---
+# --- Ukuran Papan ---
+BOARD_SIZES = {"9x9": 3, "16x16": 4, "25x25": 5}  # Label -> ukuran box
+LARGE_BOARD_TIME_LIMIT = 3.0  # Detik maksimal membuat papan besar secara langsung
 
-def generate_sudoku(k):
-    """Membuat papan Sudoku yang terpecahkan dan menghilangkan k angka."""
-    board = np.zeros((9, 9), dtype=int)
-    
-    # Isi diagonal 3x3 box untuk memastikan solusi awal yang unik
-    def fill_box(r, c):
-        nums = random.sample(range(1, 10), 9)
-        for i in range(3):
-            for j in range(3):
-                board[r + i, c + j] = nums.pop()
-
-    fill_box(0, 0)
-    fill_box(3, 3)
-    fill_box(6, 6)
-
-    # Memecahkan sisa papan
-    def solve_sudoku_util():
-        for r in range(9):
-            for c in range(9):
-                if board[r, c] == 0:
-                    for num in random.sample(range(1, 10), 9):
-                        if is_valid_move(board, r, c, num):
-                            board[r, c] = num
-                            if solve_sudoku_util():
-                                return True
-                            board[r, c] = 0  # Backtrack
-                    return False
-        return True
-    
-    solve_sudoku_util()
-    
-    # Simpan solusi untuk pemeriksaan nanti
-    solution = board.copy()
-    
-    # Menghilangkan k angka untuk membuat puzzle
-    cells = [(r, c) for r in range(9) for c in range(9)]
-    random.shuffle(cells)
-    
-    for r, c in cells:
-        if k <= 0:
-            break
-        board[r, c] = 0
-        k -= 1
-        
-    return board, solution
+# --- Fungsi Game Streamlit ---
 
-def is_valid_move(board, row, col, num):
-    """Cek apakah angka valid untuk ditempatkan di posisi (row, col)"""
-    
-    # Cek baris
-    if num in board[row, :]:
-        return False
-        
-    # Cek kolom
-    if num in board[:, col]:
-        return False
-        
-    # Cek 3x3 box
-    start_row, start_col = 3 * (row // 3), 3 * (col // 3)
-    if num in board[start_row:start_row + 3, start_col:start_col + 3]:
-        return False
-        
-    return True
+@st.cache_resource
+def get_puzzle_bank():
+    """Membuka bank puzzle (memory map) sekali per proses server."""
+    return load_bank()
 
-# --- Fungsi Game Streamlit ---
 
 def initialize_game():
     """Menginisialisasi state game baru."""
     # Jumlah sel yang dihilangkan (kesulitan)
     difficulty = st.session_state.get('difficulty', 40) 
+    box = st.session_state.get('box', 3)
     
-    # 1. Buat papan dan solusinya
-    puzzle, solution = generate_sudoku(difficulty)
+    # 1. Ambil papan dari bank, buat langsung hanya jika bank kosong (catat waktunya)
+    start = time.perf_counter()
+    if box == 3:
+        drawn = draw_puzzle(get_puzzle_bank(), difficulty)
+        if drawn is None:
+            drawn = generate_sudoku(difficulty, remember=True)
+    else:
+        # Papan besar tidak ada di bank; jumlah sel kosong diskalakan dari 9x9
+        drawn = generate_sudoku(holes_for_size(difficulty, box), box=box,
+                                max_seconds=LARGE_BOARD_TIME_LIMIT)
+    puzzle, solution = drawn
+    st.session_state.generation_ms = (time.perf_counter() - start) * 1000
     
-    # 2. Simpan ke session state
+    # 2. Simpan ke session state (penilai teknik hanya untuk papan 9x9)
     st.session_state.puzzle = puzzle.copy()
-    st.session_state.user_board = puzzle.copy()
     st.session_state.solution = solution
+    st.session_state.grade = grade(puzzle) if box == 3 else None
     
-    # 3. Tentukan sel yang diberikan (tidak bisa diubah)
-    st.session_state.given_mask = (puzzle != 0)
+    # 3. Model papan pemain (melacak sel yang diberikan, konflik, dan sel terisi)
+    st.session_state.board = BoardModel(puzzle)
     st.session_state.game_over = False
     st.session_state.message = "Selamat Bermain! Isi kotak yang kosong."
 
 def check_game():
-    """Memeriksa apakah papan pengguna benar dan lengkap."""
-    if np.array_equal(st.session_state.user_board, st.session_state.solution):
+    """Memeriksa apakah papan pengguna benar dan lengkap (O(1) lewat BoardModel)."""
+    board = st.session_state.board
+    if board.solved:
         st.session_state.game_over = True
         st.session_state.message = "🎉 SELAMAT! Anda memecahkan Sudoku ini dengan benar!"
-    elif np.count_nonzero(st.session_state.user_board == 0) == 0:
+    elif board.duplicates:
+        st.session_state.message = "Ada angka kembar di baris, kolom, atau kotak yang sama!"
+    elif board.filled == board.size * board.size:
          st.session_state.message = "Papan lengkap, tetapi masih ada kesalahan!"
     else:
         st.session_state.message = "Papan diperbarui. Terus semangat!"
 
-def get_cell_color(r, c):
+def get_cell_color(board, solution, r, c):
     """Mendapatkan warna latar belakang untuk sel berdasarkan statusnya."""
-    if st.session_state.given_mask[r, c]:
+    if board.given[r, c]:
         # Angka yang sudah ada (diberikan)
         return COLOR_GIVEN
     
-    current_val = st.session_state.user_board[r, c]
+    current_val = board.values[r, c]
     if current_val == 0:
         # Sel kosong
         return COLOR_INPUT
     
+    # Langgar aturan (angka kembar) langsung ditandai, tanpa melihat solusi
+    if board.is_conflict(r, c):
+        return COLOR_CONFLICT
+    
     # Cek validitas angka yang dimasukkan pengguna
-    if current_val == st.session_state.solution[r, c]:
+    if current_val == solution[r, c]:
         return COLOR_VALID
     else:
         return COLOR_INVALID
 
-def handle_input(r, c):
-    """Mengelola input dari pengguna di sel (r, c)."""
-    # Ambil nilai dari key input
-    try:
-        val = int(st.session_state[f'input_{r}_{c}'])
-        if 1 <= val <= 9:
-            st.session_state.user_board[r, c] = val
-        else:
-             st.session_state.user_board[r, c] = 0 # Kosongkan jika bukan 1-9
-    except:
-        st.session_state.user_board[r, c] = 0 # Kosongkan jika bukan angka
+def handle_input():
+    """Mengelola perubahan sel yang dikirim widget grid dalam satu batch."""
+    board = st.session_state.board
+    for r, c, val in grid_changes(st.session_state.grid):
+        if not board.given[r, c]:
+            board.set_cell(r, c, val if 1 <= val <= board.size else 0) # Kosongkan jika di luar 1-N
     
     # Setelah input, periksa status game
     check_game()
 
+@st.fragment
+def render_board():
+    """Menampilkan status dan papan; input sel hanya menjalankan ulang fragment ini."""
+    start = time.perf_counter()
+    st.markdown(f"**Status:** *{st.session_state.message}*", unsafe_allow_html=True)
+    
+    board = st.session_state.board
+    solution = st.session_state.solution
+    colors = [get_cell_color(board, solution, r, c) for r in range(board.size) for c in range(board.size)]
+    sudoku_grid(
+        board.values, board.given, colors,
+        box=board.box,
+        notes=board.candidate_masks() if st.session_state.get('show_notes') else None,
+        disabled=st.session_state.game_over,
+        key="grid",
+        on_change=handle_input,
+    )
+    
+    # Catat lama render papan untuk dibandingkan dengan rerun penuh
+    st.session_state.board_render_ms = (time.perf_counter() - start) * 1000
+    st.caption(f"Render papan: {st.session_state.board_render_ms:.1f} ms")
+
 # --- Setup Streamlit UI ---
 
 st.set_page_config(
@@ -177,66 +164,41 @@ with st.sidebar:
     # Pilihan Kesulitan
     st.markdown("---")
     st.subheader("Tingkat Kesulitan")
-    difficulty_mapping = {
-        "Mudah": 30,  # Lebih banyak angka yang diberikan
-        "Sedang": 40,
-        "Sulit": 50,  # Lebih sedikit angka yang diberikan
-    }
+    difficulty_mapping = DIFFICULTY_MAPPING
     
     difficulty_label = st.selectbox("Pilih kesulitan:", list(difficulty_mapping.keys()), index=1)
     st.session_state.difficulty = difficulty_mapping[difficulty_label]
     
+    size_label = st.selectbox("Ukuran papan:", list(BOARD_SIZES.keys()), index=0)
+    st.session_state.box = BOARD_SIZES[size_label]
+    
     # Tombol Aksi
     st.markdown("---")
-    if st.button("Mulai Game Baru", on_click=initialize_game):
-        st.experimental_rerun() # Rerun untuk memuat papan baru
+    st.button("Mulai Game Baru", on_click=initialize_game) # Klik memicu rerun penuh dengan papan baru
+    st.caption(f"Papan dibuat dalam {st.session_state.generation_ms:.0f} ms")
+    if st.session_state.grade:
+        score, technique = st.session_state.grade
+        st.caption(f"Teknik tersulit: {technique} (skor {score})")
         
     st.markdown("---")
+    st.toggle("Tampilkan kandidat (pencil mark)", key="show_notes")
     if st.button("Tampilkan Solusi 💡"):
-        st.session_state.user_board = st.session_state.solution.copy()
+        # Lengkapi isian pemain jika masih bisa diselesaikan, jika tidak dari puzzle awal
+        # (papan besar langsung memakai solusi tersimpan agar tidak menunggu pencarian)
+        if st.session_state.board.box == 3:
+            solved = solve(st.session_state.board.values)
+            if solved is None:
+                solved = cached_solve(st.session_state.puzzle)
+            if solved is not None:
+                st.session_state.solution = solved
+        st.session_state.board.load(st.session_state.solution)
         st.session_state.game_over = True
         st.session_state.message = "Ini Solusinya. Game Selesai."
 
 
 # --- Area Game Utama ---
-st.markdown(f"**Status:** *{st.session_state.message}*", unsafe_allow_html=True)
-
-# Grid Sudoku (9 kolom)
-cols = st.columns(9)
+render_board()
 
-# Iterasi untuk mengisi sel
-for r in range(9):
-    for c in range(9):
-        # Tentukan style sel berdasarkan posisi dan box 3x3
-        style = f"background-color: {get_cell_color(r, c)}; text-align: center; padding: 5px;"
-        
-        # Tambahkan border tebal untuk memisahkan box 3x3
-        if c % 3 == 0 and c != 0:
-            style += " border-left: 3px solid #333333;"
-        if r % 3 == 0 and r != 0:
-            style += " border-top: 3px solid #333333;"
-        
-        with cols[c]:
-            if st.session_state.given_mask[r, c]:
-                # Sel yang Diberikan (angka tebal, tidak bisa diubah)
-                st.markdown(f"""
-                    <div style="{style} font-weight: bold; color: #333333; height: 40px; line-height: 40px;">
-                        {st.session_state.puzzle[r, c]}
-                    </div>
-                """, unsafe_allow_html=True)
-            else:
-                # Sel Input Pengguna
-                st.text_input(
-                    label=' ',
-                    value=str(st.session_state.user_board[r, c]) if st.session_state.user_board[r, c] != 0 else '',
-                    max_chars=1,
-                    key=f'input_{r}_{c}',
-                    on_change=handle_input,
-                    args=(r, c),
-                    disabled=st.session_state.game_over,
-                    help="Masukkan angka 1-9"
-                )
-                
 # Info dan Tips
 st.markdown("---")
 st.markdown("#### Tips Mewarnai:")
@@ -245,4 +207,6 @@ st.markdown(f"""
 * Kotak **Putih ({COLOR_INPUT})**: Sel kosong yang harus diisi.
 * Kotak **Hijau Pucat ({COLOR_VALID})**: Angka yang Anda masukkan **sudah benar**.
 * Kotak **Merah Muda ({COLOR_INVALID})**: Angka yang Anda masukkan **salah**.
+* Kotak **Merah ({COLOR_CONFLICT})**: Angka **kembar** di baris, kolom, atau kotak yang sama.
+* Angka kecil di sel kosong: **kandidat** yang masih mungkin (aktifkan di sidebar).
 """)
@@ -0,0 +1,139 @@
+"""Bank puzzle Sudoku yang dibuat offline dan dibaca lewat memory map.
+
+Setiap record berisi puzzle dan solusinya sebagai dua blok 81 byte (nilai
+0-9 per sel). Indeks terpisah menyimpan nomor record per tingkat kesulitan
+sehingga pengambilan puzzle acak tidak perlu membaca seluruh file, serta
+teknik tersulit (hasil grader) untuk setiap record.
+
+Membangun bank dari folder ini:
+
+    python bank.py --per-level 2000 --workers 4
+"""
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from canonical import canonical_key
+from generator import DIFFICULTY_MAPPING, generate_sudoku
+from grader import TECHNIQUE_NAMES, grade
+
+BANK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+RECORDS_FILE = "puzzle_bank.npy"
+INDEX_FILE = "puzzle_bank_index.npz"
+RECORD_CELLS = 81
+
+
+# --- Membaca Bank ---
+
+def load_bank(directory=BANK_DIR):
+    """Membuka bank sebagai (records, index); None jika bank belum dibangun.
+
+    `records` adalah memmap berbentuk (n, 2, 81) dan `index` memetakan jumlah
+    sel kosong (k) ke array nomor record.
+    """
+    records_path = os.path.join(directory, RECORDS_FILE)
+    index_path = os.path.join(directory, INDEX_FILE)
+    if not (os.path.exists(records_path) and os.path.exists(index_path)):
+        return None
+    records = np.load(records_path, mmap_mode="r")
+    with np.load(index_path) as index_file:
+        index = {int(key): index_file[key] for key in index_file.files if key.isdigit()}
+    return records, index
+
+
+def draw_puzzle(bank, k, rng=random):
+    """Mengambil (puzzle, solution) acak untuk k sel kosong dalam waktu konstan.
+
+    Mengembalikan None jika bank kosong untuk tingkat tersebut.
+    """
+    if bank is None:
+        return None
+    records, index = bank
+    ids = index.get(k)
+    if ids is None or len(ids) == 0:
+        return None
+    record = np.array(records[ids[rng.randrange(len(ids))]], dtype=int)
+    return record[0].reshape(9, 9), record[1].reshape(9, 9)
+
+
+# --- Membangun Bank ---
+
+def _build_one(job):
+    """Worker: membuat dan menilai satu puzzle untuk (k, seed)."""
+    k, seed = job
+    random.seed(seed)
+    puzzle, solution = generate_sudoku(k)
+    _, technique = grade(puzzle)
+    record = np.stack([puzzle.ravel(), solution.ravel()]).astype(np.uint8)
+    return k, TECHNIQUE_NAMES.index(technique), record
+
+
+def build_bank(per_level, workers=None, directory=BANK_DIR, seed=None):
+    """Membuat `per_level` puzzle untuk tiap tingkat di process pool lalu menyimpannya."""
+    rng = random.Random(seed)
+    jobs = [(k, rng.getrandbits(64)) for k in DIFFICULTY_MAPPING.values() for _ in range(per_level)]
+
+    os.makedirs(directory, exist_ok=True)
+    records = np.lib.format.open_memmap(
+        os.path.join(directory, RECORDS_FILE), mode="w+",
+        dtype=np.uint8, shape=(len(jobs), 2, RECORD_CELLS),
+    )
+    index = {k: [] for k in DIFFICULTY_MAPPING.values()}
+    techniques = np.zeros(len(jobs), dtype=np.uint8)
+    seen, count = set(), 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for k, technique, record in pool.map(_build_one, jobs, chunksize=16):
+            # Puzzle yang hanya berbeda simetri/penamaan angka disimpan sekali saja
+            key = canonical_key(record[0].reshape(9, 9))
+            if key in seen:
+                continue
+            seen.add(key)
+            records[count] = record
+            techniques[count] = technique
+            index[k].append(count)
+            count += 1
+    records.flush()
+    del records
+    if count < len(jobs):
+        # Memotong record kosong di akhir file
+        path = os.path.join(directory, RECORDS_FILE)
+        np.save(path, np.load(path)[:count])
+        techniques = techniques[:count]
+
+    np.savez(
+        os.path.join(directory, INDEX_FILE),
+        technique=techniques,
+        **{str(k): np.asarray(ids, dtype=np.uint32) for k, ids in index.items()},
+    )
+    return index, techniques
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Membangun bank puzzle Sudoku.")
+    parser.add_argument("--per-level", type=int, default=1000, help="Jumlah puzzle per tingkat")
+    parser.add_argument("--workers", type=int, default=None, help="Jumlah proses (default: semua core)")
+    parser.add_argument("--output", default=BANK_DIR, help="Folder tujuan bank")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index, techniques = build_bank(args.per_level, args.workers, args.output, args.seed)
+    elapsed = time.perf_counter() - start
+    total = len(techniques)
+    duplicates = args.per_level * len(DIFFICULTY_MAPPING) - total
+    print(f"{total} puzzle unik ({duplicates} duplikat dibuang) dibuat dalam {elapsed:.1f} detik ({total / elapsed:.0f} puzzle/detik) -> {args.output}")
+
+    # Sebaran teknik tersulit per tingkat
+    for label, k in DIFFICULTY_MAPPING.items():
+        counts = np.bincount(techniques[index[k]], minlength=len(TECHNIQUE_NAMES))
+        summary = ", ".join(f"{name}: {n}" for name, n in zip(TECHNIQUE_NAMES, counts) if n)
+        print(f"  {label}: {summary}")
+
+
+if __name__ == "__main__":
+    main()
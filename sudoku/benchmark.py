@@ -0,0 +1,77 @@
+"""Mengukur latensi pembuatan puzzle per tingkat kesulitan.
+
+Jalankan dari folder ini:  python benchmark.py [--runs 50] [--budget-ms 250]
+Waktu pemecahan lintas ukuran papan:  python benchmark.py --sizes [--runs 5]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from dlx import exact_cover_solutions
+from generator import DIFFICULTY_MAPPING, generate_sudoku, holes_for_size
+from solver import solve
+
+
+def measure(k, unique, runs):
+    """Mengembalikan daftar durasi (ms) pembuatan puzzle dengan k sel kosong."""
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        generate_sudoku(k, unique=unique)
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def benchmark_sizes(runs):
+    """Mencetak waktu pemecahan (tingkat 'Sedang') untuk papan 9x9, 16x16, dan 25x25."""
+    k = DIFFICULTY_MAPPING["Sedang"]
+    print(f"{'Ukuran':<7} {'Mesin':<9} {'rata2':>9} {'maks':>9}  (pembuatan rata2)")
+    for box in (3, 4, 5):
+        n = box * box
+        puzzles, gen_times = [], []
+        for _ in range(runs):
+            start = time.perf_counter()
+            puzzles.append(generate_sudoku(holes_for_size(k, box), box=box, max_seconds=10)[0])
+            gen_times.append((time.perf_counter() - start) * 1000)
+        engines = [("dlx", lambda p, box=box: exact_cover_solutions(p, box)[0])]
+        if box == 3:
+            engines.insert(0, ("bitmask", solve))
+        for name, engine in engines:
+            durations = []
+            for puzzle in puzzles:
+                start = time.perf_counter()
+                engine(puzzle)
+                durations.append((time.perf_counter() - start) * 1000)
+            print(f"{f'{n}x{n}':<7} {name:<9} {statistics.mean(durations):>7.1f}ms {max(durations):>7.1f}ms"
+                  f"  ({statistics.mean(gen_times):.0f} ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=50, help="Jumlah puzzle per tingkat")
+    parser.add_argument("--budget-ms", type=float, default=250.0,
+                        help="Batas latensi p95 untuk 'Mulai Game Baru'")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sizes", action="store_true",
+                        help="Bandingkan waktu pemecahan untuk 9x9, 16x16, dan 25x25")
+    args = parser.parse_args()
+    random.seed(args.seed)
+
+    if args.sizes:
+        benchmark_sizes(args.runs)
+        return
+
+    print(f"{'Tingkat':<8} {'Mode':<6} {'rata2':>8} {'p95':>8} {'maks':>8}  status")
+    for label, k in DIFFICULTY_MAPPING.items():
+        for unique in (False, True):
+            durations = sorted(measure(k, unique, args.runs))
+            p95 = durations[min(len(durations) - 1, int(0.95 * len(durations)))]
+            status = "OK" if p95 <= args.budget_ms else "MELEBIHI BATAS"
+            print(f"{label:<8} {'unik' if unique else 'bebas':<6} "
+                  f"{statistics.mean(durations):>6.1f}ms {p95:>6.1f}ms {durations[-1]:>6.1f}ms  {status}")
+
+
+if __name__ == "__main__":
+    main()
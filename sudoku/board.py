@@ -0,0 +1,105 @@
+"""Model papan pemain dengan pelacakan konflik secara inkremental.
+
+Model menyimpan jumlah kemunculan tiap angka di setiap baris, kolom, dan
+box untuk papan NxN. Mengubah satu sel hanya memperbarui tiga unit yang
+memuat sel itu, sehingga konflik, jumlah sel terisi, dan status selesai
+selalu tersedia tanpa memeriksa ulang seluruh papan.
+
+Kandidat (pencil mark) disimpan sebagai tensor boolean (baris, kolom, angka)
+dan juga diperbarui secara inkremental: mengisi atau mengosongkan satu sel
+hanya menghitung ulang baris, kolom, dan box sel tersebut.
+"""
+
+import numpy as np
+
+from solver import box_size
+
+
+class BoardModel:
+    """Papan pemain NxN beserta hitungan angka per unit."""
+
+    def __init__(self, puzzle):
+        self.box = box_size(puzzle)
+        self.size = n = self.box * self.box
+        self.values = np.zeros((n, n), dtype=int)
+        self.given = np.asarray(puzzle) != 0
+        self.counts = np.zeros((3 * n, n + 1), dtype=int)
+        self.filled = 0
+        self.duplicates = 0  # Total kelebihan angka kembar di semua unit
+        self.box_of = np.add.outer(np.arange(n) // self.box * self.box, np.arange(n) // self.box)
+        # Koordinat (baris, kolom) sel untuk setiap unit: n baris, n kolom, n box
+        rows, cols = np.indices((n, n))
+        order = np.argsort(self.box_of.ravel(), kind="stable")
+        self._unit_cells = (
+            [(rows[i], cols[i]) for i in range(n)]
+            + [(rows[:, i], cols[:, i]) for i in range(n)]
+            + list(zip(rows.ravel()[order].reshape(n, n), cols.ravel()[order].reshape(n, n)))
+        )
+        for (r, c), val in np.ndenumerate(puzzle):
+            self._set(r, c, int(val))
+        self.candidates = self._candidates_at(rows, cols)
+
+    def set_cell(self, r, c, val):
+        """Mengisi sel (r, c) dengan val (0 = kosong) dan memperbarui hitungan serta kandidat."""
+        if self._set(r, c, val):
+            for u in self._units(r, c):
+                rows, cols = self._unit_cells[u]
+                self.candidates[rows, cols] = self._candidates_at(rows, cols)
+
+    def _set(self, r, c, val):
+        """Memperbarui nilai dan hitungan unit; False jika nilai tidak berubah."""
+        old = int(self.values[r, c])
+        if old == val:
+            return False
+        units = self._units(r, c)
+        if old:
+            self.filled -= 1
+            for u in units:
+                self.counts[u][old] -= 1
+                if self.counts[u][old] >= 1:
+                    self.duplicates -= 1
+        if val:
+            self.filled += 1
+            for u in units:
+                self.counts[u][val] += 1
+                if self.counts[u][val] > 1:
+                    self.duplicates += 1
+        self.values[r, c] = val
+        return True
+
+    def _candidates_at(self, rows, cols):
+        """Kandidat untuk sel-sel (rows, cols): angka yang belum ada di ketiga unit sel kosong."""
+        n = self.size
+        free = self.counts[:, 1:] == 0
+        return (
+            (self.values[rows, cols] == 0)[..., None]
+            & free[rows]
+            & free[n + cols]
+            & free[2 * n + self.box_of[rows, cols]]
+        )
+
+    def _units(self, r, c):
+        """Indeks unit (baris, kolom, box) yang memuat sel (r, c)."""
+        n, box = self.size, self.box
+        return r, n + c, 2 * n + (r // box) * box + c // box
+
+    def load(self, board):
+        """Mengganti isi sel yang bukan angka awal dengan isi `board`."""
+        for (r, c), val in np.ndenumerate(board):
+            if not self.given[r, c]:
+                self._set(r, c, int(val))
+        self.candidates = self._candidates_at(*np.indices(self.values.shape))
+
+    def is_conflict(self, r, c):
+        """True jika angka di (r, c) muncul lebih dari sekali di salah satu unitnya."""
+        val = int(self.values[r, c])
+        return bool(val) and any(self.counts[u][val] > 1 for u in self._units(r, c))
+
+    def candidate_masks(self):
+        """Kandidat per sel sebagai bitmask (bit d-1 untuk angka d), urutan baris."""
+        return (self.candidates.astype(np.int64) << np.arange(self.size)).sum(axis=2).ravel()
+
+    @property
+    def solved(self):
+        """Papan penuh tanpa angka kembar berarti sudah memenuhi semua aturan."""
+        return self.filled == self.size * self.size and self.duplicates == 0
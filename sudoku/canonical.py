@@ -0,0 +1,225 @@
+"""Bentuk kanonik papan 9x9 dan cache solusi berbasis bentuk kanonik.
+
+Dua puzzle dianggap sama jika yang satu bisa diperoleh dari yang lain lewat
+transposisi, penukaran band/stack, penukaran baris di dalam band, penukaran
+kolom di dalam stack, dan penamaan ulang angka. Bentuk kanonik adalah
+representasi terkecil (leksikografis, sel kosong = 0) di antara semua
+transformasi tersebut. Pencarian dilakukan baris demi baris dan hanya
+cabang yang menghasilkan baris terkecil yang dilanjutkan; semua
+permutasi kolom (1296) dievaluasi sekaligus dengan NumPy.
+
+Papan yang sangat jarang (kurang dari 17 angka, atau terlalu banyak cabang
+yang seri) memakai papan mentahnya sebagai kunci: jumlah cabang di sana
+meledak hingga detik per papan, dan papan seperti itu tidak pernah menjadi
+puzzle dengan solusi tunggal.
+"""
+
+import itertools
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from solver import find_solutions
+
+N = 9
+
+# Semua permutasi kolom yang mempertahankan struktur stack: (1296, 9)
+_PERM3 = list(itertools.permutations(range(3)))
+COL_PERMS = np.array([
+    [stack * 3 + inner[stack_pos][i] for stack_pos, stack in enumerate(stacks) for i in range(3)]
+    for stacks in _PERM3
+    for inner in itertools.product(_PERM3, repeat=3)
+])
+_POW = 10 ** np.arange(N - 1, -1, -1, dtype=np.int64)
+
+MIN_CLUES = 17             # Puzzle dengan solusi tunggal selalu punya minimal 17 angka
+MAX_BRANCH_PERMS = 30000   # Batas permutasi kolom yang seri per langkah (papan penuh ~23000)
+
+
+def _next_rows(rows):
+    """Baris asli yang boleh menempati posisi berikutnya dalam urutan baris."""
+    if len(rows) % 3 == 0:
+        used_bands = {r // 3 for r in rows}
+        return [r for r in range(N) if r // 3 not in used_bands]
+    band = rows[-1] // 3
+    return [r for r in range(band * 3, band * 3 + 3) if r not in rows]
+
+
+def _relabel_row(values, maps, next_label):
+    """Menamai ulang angka satu baris (k, 9) untuk k kandidat sekaligus.
+
+    Angka dalam satu baris selalu berbeda, sehingga angka yang belum punya
+    label cukup diberi label berurutan sesuai posisinya di baris. Mengembalikan
+    (baris berlabel, mask angka yang baru diberi label).
+    """
+    known = np.take_along_axis(maps, values, axis=1)
+    new = (values > 0) & (known == 0)
+    return np.where(new, next_label[:, None] + np.cumsum(new, axis=1) - 1, known), new
+
+
+def _extend_maps(maps, next_label, values, relabeled, new):
+    """Menyimpan label baru ke peta angka (hanya untuk cabang yang dipertahankan)."""
+    maps = maps.copy()
+    rows = np.nonzero(new)[0]
+    maps[rows, values[new]] = relabeled[new]
+    return maps, next_label + new.sum(axis=1)
+
+
+def _raw_form(board):
+    """Kunci cadangan: papan apa adanya dengan transformasi identitas."""
+    return (np.asarray(board, dtype=np.uint8).tobytes(),
+            (False, tuple(range(N)), tuple(range(N)), np.arange(N + 1, dtype=np.int64)))
+
+
+def canonical_form(board):
+    """Mengembalikan (kunci bytes 81, transformasi) untuk papan 9x9.
+
+    Transformasi berbentuk (transpose, urutan baris, urutan kolom, peta angka)
+    dan bisa dibalik dengan `restore`. Papan yang terlalu jarang atau terlalu
+    simetris mendapat kunci papan mentah (lihat docstring modul).
+    """
+    board = np.asarray(board, dtype=np.int64)
+    if np.count_nonzero(board) < MIN_CLUES:
+        return _raw_form(board)
+    grids = (board, board.T)
+
+    # Setiap cabang: (transpose, urutan baris, indeks permutasi kolom, peta angka, label berikutnya)
+    branches = [
+        (t, (), np.arange(len(COL_PERMS)), np.zeros((len(COL_PERMS), N + 1), dtype=np.int64),
+         np.ones(len(COL_PERMS), dtype=np.int64))
+        for t in (0, 1)
+    ]
+    canonical_rows = []
+    for _ in range(N):
+        candidates, best = [], None
+        for t, rows, perms, maps, next_label in branches:
+            for r in _next_rows(list(rows)):
+                values = grids[t][r][COL_PERMS[perms]]
+                relabeled, new = _relabel_row(values, maps, next_label)
+                keys = relabeled @ _POW
+                row_best = keys.min()
+                if best is not None and row_best > best:
+                    continue
+                if best is None or row_best < best:
+                    best, candidates = row_best, []
+                keep = keys == row_best
+                new_maps, new_next = _extend_maps(
+                    maps[keep], next_label[keep], values[keep], relabeled[keep], new[keep])
+                candidates.append((t, rows + (r,), perms[keep], new_maps, new_next))
+        branches = candidates
+        if sum(len(perms) for _, _, perms, _, _ in branches) > MAX_BRANCH_PERMS:
+            return _raw_form(board)
+        canonical_rows.append(best)
+
+    t, rows, perms, maps, _ = branches[0]
+    digits = np.array([[row // p % 10 for p in _POW] for row in canonical_rows], dtype=np.uint8)
+    return digits.tobytes(), (bool(t), rows, tuple(COL_PERMS[perms[0]]), maps[0].copy())
+
+
+def _complete(relabel):
+    """Melengkapi peta angka untuk angka yang tidak muncul di puzzle (bisa dipertukarkan)."""
+    relabel = relabel.copy()
+    unused_labels = iter(sorted(set(range(1, N + 1)) - set(relabel[1:].tolist())))
+    for digit in range(1, N + 1):
+        if relabel[digit] == 0:
+            relabel[digit] = next(unused_labels)
+    return relabel
+
+
+def restore(canonical_board, transform):
+    """Membalik transformasi: papan kanonik (misalnya solusinya) -> papan asli."""
+    transposed, rows, cols, relabel = transform
+    relabel = _complete(relabel)
+    inverse = np.zeros(N + 1, dtype=np.int64)
+    inverse[relabel] = np.arange(N + 1)
+
+    original = np.zeros((N, N), dtype=int)
+    original[np.ix_(rows, cols)] = inverse[np.asarray(canonical_board, dtype=np.int64)]
+    return original.T if transposed else original
+
+
+# --- Cache Solusi ---
+
+class SolutionCache:
+    """Cache LRU (aman antar-thread) berisi (jumlah solusi, solusi kanonik) per bentuk kanonik.
+
+    Papan yang persis sama dengan papan sebelumnya langsung dikenali lewat
+    byte mentahnya, tanpa menghitung ulang bentuk kanonik.
+    """
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._aliases = OrderedDict()  # Byte papan asli -> (kunci kanonik, transformasi)
+        self._lock = threading.Lock()
+
+    def _canonical(self, board):
+        raw = np.asarray(board, dtype=np.uint8).tobytes()
+        with self._lock:
+            alias = self._aliases.get(raw)
+            if alias is not None:
+                self._aliases.move_to_end(raw)
+                return alias
+        alias = canonical_form(board)
+        with self._lock:
+            self._aliases[raw] = alias
+            if len(self._aliases) > self.maxsize:
+                self._aliases.popitem(last=False)
+        return alias
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def lookup(self, board):
+        """Mengembalikan (jumlah solusi hingga 2, solusi dalam orientasi papan asli atau None)."""
+        key, transform = self._canonical(board)
+        entry = self.get(key)
+        if entry is None:
+            canonical = np.frombuffer(key, dtype=np.uint8).reshape(N, N)
+            solutions = find_solutions(canonical, limit=2)
+            entry = (len(solutions), solutions[0] if solutions else None)
+            self.put(key, entry)
+        count, solution = entry
+        return count, (restore(solution, transform) if solution is not None else None)
+
+    def remember(self, puzzle, solution):
+        """Menyimpan solusi yang sudah diketahui (misalnya dari generator) ke cache."""
+        key, transform = self._canonical(puzzle)
+        transposed, rows, cols, relabel = transform
+        oriented = np.asarray(solution).T if transposed else np.asarray(solution)
+        canonical = _complete(relabel)[oriented[np.ix_(rows, cols)]]
+        self.put(key, (1, canonical))
+
+
+# Satu cache per proses, dipakai bersama oleh semua sesi
+solution_cache = SolutionCache()
+
+
+def cached_solve(board):
+    """Memecahkan papan lewat cache kanonik; papan selain 9x9 langsung dipecahkan."""
+    if np.asarray(board).shape != (N, N):
+        solutions = find_solutions(board, limit=1)
+        return solutions[0] if solutions else None
+    return solution_cache.lookup(board)[1]
+
+
+def canonical_key(board):
+    """Kunci hash bentuk kanonik untuk deteksi duplikat."""
+    return canonical_form(board)[0]
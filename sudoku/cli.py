@@ -0,0 +1,200 @@
+"""CLI batch untuk memecahkan, memvalidasi, dan membuat puzzle Sudoku.
+
+Format file: satu puzzle per baris, 81 karakter ('0' atau '.' untuk sel
+kosong). Papan besar (--box 4 atau 5) memakai 256/625 karakter dengan
+angka 10 ke atas ditulis sebagai huruf A, B, C, ... Baris kosong dan baris
+yang diawali '#' dilewati.
+
+Contoh (dari folder ini):
+
+    python cli.py solve puzzles.txt -o solusi.txt --workers 8
+    python cli.py validate puzzles.txt
+    python cli.py generate -n 10000 --holes 50 -o puzzles.txt
+    python cli.py validate puzzles16.txt --box 4
+    python cli.py dedup puzzles.txt -o unik.txt
+"""
+
+import argparse
+import functools
+import itertools
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from canonical import canonical_key
+from generator import generate_sudoku
+from solver import count_solutions, solve
+
+# Jumlah puzzle yang diproses per batch per worker; membatasi memori saat streaming
+BATCH_PER_WORKER = 256
+
+# Simbol sel: indeks = nilai (0 = kosong)
+SYMBOLS = "0123456789ABCDEFGHIJKLMNOP"
+
+
+# --- Format Baris ---
+
+def parse_line(line, box=3):
+    """Mengubah baris N*N karakter menjadi papan NxN; None jika formatnya salah."""
+    n = box * box
+    text = line.strip().upper().replace(".", "0")
+    if len(text) != n * n:
+        return None
+    values = [SYMBOLS.find(ch) for ch in text]
+    if not all(0 <= v <= n for v in values):
+        return None
+    return np.array(values, dtype=int).reshape(n, n)
+
+
+def format_board(board):
+    """Mengubah papan NxN menjadi string N*N karakter."""
+    return "".join(SYMBOLS[v] for v in np.asarray(board).ravel())
+
+
+# --- Pekerjaan per Puzzle (dijalankan di worker, mengembalikan (status, teks)) ---
+
+def _solve_line(line, box=3):
+    board = parse_line(line, box)
+    if board is None:
+        return "format-salah", "-"
+    solution = solve(board)
+    if solution is None:
+        return "tidak-ada-solusi", "-"
+    return "ok", format_board(solution)
+
+
+def _validate_line(line, box=3):
+    board = parse_line(line, box)
+    if board is None:
+        return "format-salah", "format-salah"
+    count = count_solutions(board, limit=2)
+    status = {0: "tidak-ada-solusi", 1: "ok"}.get(count, "solusi-ganda")
+    return status, status
+
+
+def _canonical_line(line):
+    board = parse_line(line)
+    if board is None:
+        return "format-salah", ""
+    return "ok", canonical_key(board).hex()
+
+
+def _generate_one(job, box=3):
+    holes, seed = job
+    random.seed(seed)
+    puzzle, solution = generate_sudoku(holes, box=box)
+    return "ok", f"{format_board(puzzle)}\t{format_board(solution)}"
+
+
+# --- Menjalankan Batch ---
+
+def _read_puzzles(path):
+    """Membaca baris puzzle secara streaming (tanpa memuat seluruh file)."""
+    handle = sys.stdin if path == "-" else open(path)
+    with handle:
+        for line in handle:
+            if line.strip() and not line.startswith("#"):
+                yield line.rstrip("\n")
+
+
+def run_batches(func, items, output, workers, echo_input=True, on_result=None):
+    """Menjalankan func pada items di process pool dan menulis hasil bertahap.
+
+    Secara default setiap hasil ditulis sebagai baris ke `output`;
+    `on_result(item, status, text)` menggantikan penulisan itu (misalnya untuk
+    menyaring hasil). Mengembalikan (jumlah item, hitungan per status untuk
+    ringkasan).
+    """
+    if on_result is None:
+        def on_result(item, status, text):
+            output.write(f"{item}\t{text}\n" if echo_input else f"{text}\n")
+
+    workers = workers or os.cpu_count() or 1
+    batch_size = BATCH_PER_WORKER * workers
+    items = iter(items)
+    total, tally = 0, {}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            batch = list(itertools.islice(items, batch_size))
+            if not batch:
+                break
+            chunksize = max(1, len(batch) // (workers * 4))
+            for item, (status, text) in zip(batch, pool.map(func, batch, chunksize=chunksize)):
+                on_result(item, status, text)
+                tally[status] = tally.get(status, 0) + 1
+            output.flush()
+            total += len(batch)
+            elapsed = time.perf_counter() - start
+            print(f"\r{total} puzzle, {total / elapsed:.0f} puzzle/detik", end="", file=sys.stderr)
+    elapsed = time.perf_counter() - start
+    print(f"\rSelesai: {total} puzzle dalam {elapsed:.2f} detik "
+          f"({total / max(elapsed, 1e-9):.0f} puzzle/detik)", file=sys.stderr)
+    return total, tally
+
+
+def dedup_puzzles(lines, output, workers):
+    """Menulis hanya puzzle pertama dari setiap bentuk kanonik (cek duplikat = lookup set)."""
+    seen, duplicates = set(), 0
+
+    def keep_first(line, status, key):
+        nonlocal duplicates
+        if status == "ok" and key in seen:
+            duplicates += 1
+            return
+        seen.add(key)
+        output.write(line + "\n")
+
+    total, tally = run_batches(_canonical_line, lines, output, workers, on_result=keep_first)
+    print(f"Duplikat dibuang: {duplicates} dari {total}", file=sys.stderr)
+    return 1 if tally.get("format-salah") else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve/validate/generate Sudoku secara batch.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for name, help_text in (("solve", "Memecahkan setiap puzzle"),
+                            ("validate", "Memeriksa jumlah solusi setiap puzzle")):
+        cmd = sub.add_parser(name, help=help_text)
+        cmd.add_argument("input", help="File puzzle ('-' untuk stdin)")
+    dedup = sub.add_parser("dedup", help="Membuang puzzle 9x9 yang sama dalam bentuk lain")
+    dedup.add_argument("input", help="File puzzle ('-' untuk stdin)")
+    gen = sub.add_parser("generate", help="Membuat puzzle baru berikut solusinya")
+    gen.add_argument("-n", "--count", type=int, default=1000)
+    gen.add_argument("--holes", type=int, default=40, help="Jumlah sel kosong")
+    gen.add_argument("--seed", type=int, default=None)
+    for cmd in sub.choices.values():
+        cmd.add_argument("-o", "--output", default="-", help="File hasil ('-' untuk stdout)")
+        cmd.add_argument("--workers", type=int, default=None, help="Jumlah proses (default: semua core)")
+        cmd.add_argument("--box", type=int, default=3, choices=(3, 4, 5),
+                         help="Ukuran box: 3 (9x9), 4 (16x16), 5 (25x25)")
+    args = parser.parse_args(argv)
+
+    output = sys.stdout if args.output == "-" else open(args.output, "w")
+    with output:
+        if args.command == "generate":
+            rng = random.Random(args.seed)
+            jobs = ((args.holes, rng.getrandbits(64)) for _ in range(args.count))
+            run_batches(functools.partial(_generate_one, box=args.box), jobs, output,
+                        args.workers, echo_input=False)
+            return 0
+        if args.command == "dedup":
+            if args.box != 3:
+                parser.error("dedup hanya mendukung papan 9x9 (--box 3)")
+            return dedup_puzzles(_read_puzzles(args.input), output, args.workers)
+        func = functools.partial(_solve_line if args.command == "solve" else _validate_line, box=args.box)
+        _, tally = run_batches(func, _read_puzzles(args.input), output, args.workers)
+
+    summary = ", ".join(f"{status}: {n}" for status, n in sorted(tally.items()))
+    print(f"Ringkasan: {summary}", file=sys.stderr)
+    # Kode keluar 1 jika ada puzzle yang gagal, agar bisa dipakai di pipeline rilis
+    failed = sum(n for status, n in tally.items() if status != "ok")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""Pemecah exact cover (Algorithm X Knuth dengan dancing links) untuk Sudoku NxN.
+
+Papan berukuran N = box * box. Setiap baris matriks mewakili pilihan
+(sel, angka) dan mengisi empat kolom batasan: sel terisi, angka di baris,
+angka di kolom, dan angka di box. Hanya batasan yang belum dipenuhi angka
+awal yang dibuat, sehingga papan yang hampir penuh menghasilkan matriks kecil.
+"""
+
+import sys
+
+import numpy as np
+
+
+class _Links:
+    """Matriks sparse dancing links yang disimpan dalam list paralel."""
+
+    def __init__(self, ncols):
+        # Node 0 adalah root, node 1..ncols adalah header kolom
+        self.L = [ncols] + list(range(ncols))
+        self.R = list(range(1, ncols + 1)) + [0]
+        self.U = list(range(ncols + 1))
+        self.D = list(range(ncols + 1))
+        self.C = list(range(ncols + 1))
+        self.row = [-1] * (ncols + 1)
+        self.size = [0] * (ncols + 1)
+
+    def add_row(self, cols, row_id):
+        L, R, U, D, C = self.L, self.R, self.U, self.D, self.C
+        first = len(L)
+        for k, col in enumerate(cols):
+            node = first + k
+            L.append(node - 1 if k else first + len(cols) - 1)
+            R.append(node + 1 if k < len(cols) - 1 else first)
+            U.append(U[col])
+            D.append(col)
+            C.append(col)
+            self.row.append(row_id)
+            D[U[col]] = node
+            U[col] = node
+            self.size[col] += 1
+
+    def cover(self, col):
+        L, R, U, D, C, size = self.L, self.R, self.U, self.D, self.C, self.size
+        L[R[col]] = L[col]
+        R[L[col]] = R[col]
+        i = D[col]
+        while i != col:
+            j = R[i]
+            while j != i:
+                D[U[j]] = D[j]
+                U[D[j]] = U[j]
+                size[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def uncover(self, col):
+        L, R, U, D, C, size = self.L, self.R, self.U, self.D, self.C, self.size
+        i = U[col]
+        while i != col:
+            j = L[i]
+            while j != i:
+                size[C[j]] += 1
+                D[U[j]] = j
+                U[D[j]] = j
+                j = L[j]
+            i = U[i]
+        L[R[col]] = col
+        R[L[col]] = col
+
+
+def _build(board, box):
+    """Membuat matriks untuk papan; None jika angka awal saling bentrok."""
+    n = box * box
+    values = np.asarray(board).reshape(n, n)
+
+    # Angka terpakai per unit, dihitung sekaligus dengan NumPy
+    digits = values[:, :, None] == np.arange(1, n + 1)
+    row_count = digits.sum(axis=1)
+    col_count = digits.sum(axis=0)
+    box_count = digits.reshape(box, box, box, box, n).sum(axis=(1, 3)).reshape(n, n)
+    if max(row_count.max(), col_count.max(), box_count.max()) > 1:
+        return None
+
+    # Kolom batasan global: sel, baris-angka, kolom-angka, box-angka
+    satisfied = np.concatenate([
+        (values != 0).ravel(), row_count.ravel() > 0,
+        col_count.ravel() > 0, box_count.ravel() > 0,
+    ])
+    header = np.cumsum(~satisfied)  # Nomor header (1..ncols) untuk kolom yang belum dipenuhi
+
+    # Baris matriks: pasangan (sel, angka) yang masih mungkin
+    box_of = np.add.outer(np.arange(n) // box * box, np.arange(n) // box)
+    candidates = (
+        (values == 0)[:, :, None]
+        & (row_count == 0)[:, None, :]
+        & (col_count == 0)[None, :, :]
+        & (box_count == 0)[box_of]
+    )
+    r, c, d = np.nonzero(candidates)
+    cols = np.stack([
+        r * n + c,
+        n * n + r * n + d,
+        2 * n * n + c * n + d,
+        3 * n * n + box_of[r, c] * n + d,
+    ], axis=1)
+
+    links = _Links(int(header[-1]))
+    for row_cols, row_id in zip(header[cols].tolist(), ((r * n + c) * n + d).tolist()):
+        links.add_row(row_cols, row_id)
+    return links
+
+
+def exact_cover_solutions(board, box, limit=1, rng=None, node_limit=None):
+    """Mencari hingga `limit` solusi papan NxN (0 = kosong).
+
+    Mengembalikan list papan solusi (np.ndarray). Jika `rng` diberikan, urutan
+    baris yang dicoba diacak sehingga papan kosong menghasilkan solusi acak.
+    Jika pencarian melewati `node_limit` langkah, hasilnya None (tidak diketahui).
+    """
+    links = _build(board, box)
+    if links is None:
+        return []
+    n = box * box
+    L, R, D, C, size, row = links.L, links.R, links.D, links.C, links.size, links.row
+    base = np.array(board, dtype=int).ravel()
+    chosen, solutions = [], []
+    budget = [node_limit if node_limit is not None else -1]
+
+    def search():
+        budget[0] -= 1
+        if budget[0] == 0:
+            return True  # Anggaran habis, hentikan pencarian
+        if R[0] == 0:
+            grid = base.copy()
+            for row_id in chosen:
+                grid[row_id // n] = row_id % n + 1
+            solutions.append(grid.reshape(n, n))
+            return len(solutions) >= limit
+
+        # Pilih kolom dengan baris paling sedikit
+        col, best = 0, sys.maxsize
+        j = R[0]
+        while j:
+            if size[j] < best:
+                col, best = j, size[j]
+                if best <= 1:
+                    break
+            j = R[j]
+        if best == 0:
+            return False
+
+        links.cover(col)
+        options = []
+        i = D[col]
+        while i != col:
+            options.append(i)
+            i = D[i]
+        if rng is not None:
+            rng.shuffle(options)
+        for i in options:
+            chosen.append(row[i])
+            j = R[i]
+            while j != i:
+                links.cover(C[j])
+                j = R[j]
+            if search():
+                return True  # Matriks tidak dipakai lagi, tidak perlu dipulihkan
+            j = L[i]
+            while j != i:
+                links.uncover(C[j])
+                j = L[j]
+            chosen.pop()
+        links.uncover(col)
+        return False
+
+    # Kedalaman rekursi paling banyak sama dengan jumlah sel kosong (625 untuk 25x25)
+    search()
+    if budget[0] == 0:
+        return None
+    return solutions
@@ -0,0 +1,103 @@
+"""Pembuatan puzzle Sudoku, terpisah dari UI agar bisa dipakai ulang oleh tooling."""
+
+import random
+import time
+
+import numpy as np
+
+from canonical import solution_cache
+from dlx import exact_cover_solutions
+from solver import count_solutions, solve
+
+# Batas langkah pencarian per cek keunikan pada papan besar; jika terlampaui,
+# sel dianggap tidak aman untuk dihapus sehingga puzzle tetap unik
+UNIQUENESS_NODE_LIMIT = 500
+
+# Batas langkah per percobaan mengisi papan besar kosong; waktu isi acak punya
+# ekor panjang (25x25: 0,1 s hingga 9 s), jadi percobaan yang macet diulang
+# dengan urutan acak baru, paling lama FILL_TIME_SHARE x max_seconds
+FILL_NODE_LIMIT = 2000
+FILL_TIME_SHARE = 0.5
+
+# Jumlah sel yang dihilangkan untuk tiap tingkat kesulitan
+DIFFICULTY_MAPPING = {
+    "Mudah": 30,  # Lebih banyak angka yang diberikan
+    "Sedang": 40,
+    "Sulit": 50,  # Lebih sedikit angka yang diberikan
+}
+
+
+def holes_for_size(k, box):
+    """Menskalakan jumlah sel kosong k (untuk 9x9) ke papan berukuran box*box."""
+    n = box * box
+    return round(k * n * n / 81)
+
+
+def _pattern_solution(box):
+    """Solusi dari pola baku, diacak lewat urutan band/stack, baris/kolom di dalamnya, dan angka."""
+    n = box * box
+
+    def shuffled_lines():
+        return [band * box + i for band in random.sample(range(box), box) for i in random.sample(range(box), box)]
+
+    rows = np.array(shuffled_lines())[:, None]
+    cols = np.array(shuffled_lines())[None, :]
+    digits = np.array([0] + random.sample(range(1, n + 1), n))
+    return digits[(box * (rows % box) + rows // box + cols) % n + 1]
+
+
+def _random_solution(box, deadline=None):
+    """Papan penuh acak; papan besar diisi dengan anggaran langkah dan diulang hingga `deadline`."""
+    n = box * box
+    if box == 3:
+        return solve(np.zeros((n, n), dtype=int), rng=random)
+    while deadline is None or time.perf_counter() < deadline:
+        solutions = exact_cover_solutions(np.zeros((n, n), dtype=int), box, limit=1,
+                                          rng=random, node_limit=FILL_NODE_LIMIT)
+        if solutions:
+            return solutions[0]
+    return _pattern_solution(box)
+
+
+def generate_sudoku(k, unique=True, box=3, max_seconds=None, remember=False):
+    """Membuat papan Sudoku NxN (N = box*box) yang terpecahkan dan menghilangkan k angka.
+
+    Dengan unique=True, sel dihapus satu per satu dan penghapusan hanya
+    dipertahankan jika puzzle masih memiliki tepat satu solusi. Jika tidak
+    ada lagi sel yang bisa dihapus, atau waktu `max_seconds` habis, puzzle
+    bisa berisi kurang dari k sel kosong, tetapi selalu minimal satu. Dengan remember=True (papan 9x9),
+    solusinya disimpan ke `solution_cache` proses ini; hanya berguna di proses
+    yang nanti memakai cache tersebut (aplikasi), bukan di worker batch.
+    """
+    start = time.perf_counter()
+    # Memecahkan papan kosong dengan urutan angka acak untuk solusi acak
+    n = box * box
+    fill_deadline = start + FILL_TIME_SHARE * max_seconds if max_seconds is not None else None
+    board = _random_solution(box, fill_deadline)
+
+    # Simpan solusi untuk pemeriksaan nanti
+    solution = board.copy()
+
+    # Menghilangkan k angka untuk membuat puzzle
+    cells = [(r, c) for r in range(n) for c in range(n)]
+    random.shuffle(cells)
+
+    holes = 0
+    for r, c in cells:
+        if k <= 0:
+            break
+        if holes and max_seconds is not None and time.perf_counter() - start > max_seconds:
+            break
+        removed = board[r, c]
+        board[r, c] = 0
+        node_limit = UNIQUENESS_NODE_LIMIT if box != 3 else None
+        if unique and count_solutions(board, limit=2, node_limit=node_limit) != 1:
+            board[r, c] = removed  # Kembalikan, solusi tidak lagi tunggal
+            continue
+        k -= 1
+        holes += 1
+
+    # Simpan ke cache solusi agar "Tampilkan Solusi" dan validasi tidak memecahkan ulang
+    if remember and box == 3:
+        solution_cache.remember(board, solution)
+    return board, solution
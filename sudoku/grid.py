@@ -0,0 +1,42 @@
+"""Widget grid Sudoku tunggal (komponen Streamlit kustom).
+
+Seluruh papan dikirim ke browser dalam satu payload dan komponen hanya
+mengembalikan sel yang berubah dalam bentuk {"seq": n, "changes": [[r, c, val], ...]}.
+"""
+
+import os
+
+import streamlit.components.v1 as components
+
+_grid_component = components.declare_component(
+    "sudoku_grid",
+    path=os.path.join(os.path.dirname(os.path.abspath(__file__)), "grid_component"),
+)
+
+
+def sudoku_grid(values, given, colors, box=3, notes=None, disabled=False, key=None, on_change=None):
+    """Menampilkan papan sebagai satu widget.
+
+    `values` dan `given` adalah array persegi, `colors` daftar warna per sel
+    (urutan baris). `notes` (opsional) berisi bitmask kandidat per sel yang
+    ditampilkan kecil di sel kosong. Perubahan terakhir bisa dibaca dari
+    st.session_state[key].
+    """
+    return _grid_component(
+        values=[int(v) for v in values.ravel()],
+        given=[bool(g) for g in given.ravel()],
+        colors=list(colors),
+        box=box,
+        notes=None if notes is None else [int(m) for m in notes],
+        disabled=disabled,
+        key=key,
+        on_change=on_change,
+        default=None,
+    )
+
+
+def grid_changes(value):
+    """Mengambil daftar (r, c, val) dari nilai komponen."""
+    if not value:
+        return []
+    return [(int(r), int(c), int(val)) for r, c, val in value["changes"]]
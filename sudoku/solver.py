@@ -0,0 +1,217 @@
+"""Mesin pemecah Sudoku berbasis bitmask dan propagasi batasan.
+
+Setiap baris, kolom, dan box 3x3 menyimpan mask 9-bit angka yang sudah
+terpakai, sehingga kandidat sebuah sel cukup dihitung dengan operasi bit.
+Pencarian memilih sel dengan kandidat paling sedikit lebih dulu dan
+mempropagasikan naked single serta hidden single sebelum bercabang.
+"""
+
+import math
+
+import numpy as np
+
+from dlx import exact_cover_solutions
+
+# --- Tabel Bantu ---
+N = 9
+ALL = (1 << N) - 1  # Mask semua angka 1-9
+CELLS = range(N * N)
+
+# Indeks unit: baris 0-8, kolom 9-17, box 18-26
+CELL_UNITS = [
+    (i // N, N + i % N, 2 * N + (i // N // 3) * 3 + (i % N) // 3)
+    for i in CELLS
+]
+UNITS = [[] for _ in range(3 * N)]
+for _i in CELLS:
+    for _u in CELL_UNITS[_i]:
+        UNITS[_u].append(_i)
+del _i, _u
+
+
+# --- Operasi Dasar ---
+
+def _candidates(used, i):
+    """Mask kandidat untuk sel i."""
+    a, b, c = CELL_UNITS[i]
+    return ALL & ~(used[a] | used[b] | used[c])
+
+
+def _place(grid, used, i, bit):
+    """Menempatkan angka (dalam bentuk bit) di sel i."""
+    grid[i] = bit.bit_length()
+    for u in CELL_UNITS[i]:
+        used[u] |= bit
+
+
+def _load(board):
+    """Mengubah papan 9x9 menjadi (grid, used); None jika angka awal bentrok."""
+    grid = [0] * (N * N)
+    used = [0] * (3 * N)
+    for i, val in enumerate(np.asarray(board).ravel().tolist()):
+        if val == 0:
+            continue
+        bit = 1 << (val - 1)
+        if any(used[u] & bit for u in CELL_UNITS[i]):
+            return None
+        _place(grid, used, i, bit)
+    return grid, used
+
+
+def _propagate(grid, used):
+    """Mengisi naked dan hidden single sampai stabil. False jika buntu."""
+    changed = True
+    while changed:
+        changed = False
+
+        # Naked single: sel dengan tepat satu kandidat
+        for i in CELLS:
+            if grid[i]:
+                continue
+            cand = _candidates(used, i)
+            if not cand:
+                return False
+            if not cand & (cand - 1):
+                _place(grid, used, i, cand)
+                changed = True
+        if changed:
+            continue
+
+        # Hidden single: angka yang hanya muat di satu sel dalam sebuah unit
+        for u, unit in enumerate(UNITS):
+            once = twice = 0
+            for i in unit:
+                if not grid[i]:
+                    cand = _candidates(used, i)
+                    twice |= once & cand
+                    once |= cand
+            if (once | used[u]) != ALL:
+                return False
+            single = once & ~twice
+            if single:
+                bit = single & -single
+                for i in unit:
+                    if not grid[i] and _candidates(used, i) & bit:
+                        _place(grid, used, i, bit)
+                        break
+                changed = True
+                break
+    return True
+
+
+def _search(grid, used, rng=None):
+    """Generator semua solusi (urutan cabang diacak jika rng diberikan)."""
+    if not _propagate(grid, used):
+        return
+
+    # Pilih sel dengan kandidat paling sedikit
+    best, best_cand, best_count = -1, 0, N + 1
+    for i in CELLS:
+        if grid[i]:
+            continue
+        cand = _candidates(used, i)
+        count = cand.bit_count()
+        if count < best_count:
+            best, best_cand, best_count = i, cand, count
+            if count == 2:
+                break
+
+    if best < 0:
+        yield grid
+        return
+
+    bits = [1 << d for d in range(N) if best_cand >> d & 1]
+    if rng is not None:
+        rng.shuffle(bits)
+    for bit in bits:
+        next_grid, next_used = grid[:], used[:]
+        _place(next_grid, next_used, best, bit)
+        yield from _search(next_grid, next_used, rng)
+
+
+# --- API Publik ---
+
+def box_size(board):
+    """Ukuran box dari papan persegi NxN (3 untuk 9x9, 4 untuk 16x16, ...)."""
+    box = math.isqrt(len(board))
+    if box * box != len(board):
+        raise ValueError(f"Ukuran papan {len(board)} bukan kuadrat sempurna")
+    return box
+
+
+def solve(board, rng=None):
+    """Memecahkan papan NxN (0 = kosong).
+
+    Mengembalikan solusi sebagai np.ndarray, atau None jika papan tidak punya
+    solusi. Jika `rng` (misalnya modul `random`) diberikan, urutan percobaan
+    angka diacak sehingga papan kosong menghasilkan solusi acak. Papan 9x9
+    memakai mesin bitmask, ukuran lain memakai exact cover (dancing links).
+    """
+    box = box_size(board)
+    if box != 3:
+        solutions = exact_cover_solutions(board, box, limit=1, rng=rng)
+        return solutions[0] if solutions else None
+    state = _load(board)
+    if state is None:
+        return None
+    for grid in _search(*state, rng):
+        return np.array(grid, dtype=int).reshape(N, N)
+    return None
+
+
+def is_valid_move(board, row, col, num):
+    """Cek apakah angka valid untuk ditempatkan di posisi (row, col)"""
+    box = box_size(board)
+
+    # Cek baris
+    if num in board[row, :]:
+        return False
+
+    # Cek kolom
+    if num in board[:, col]:
+        return False
+
+    # Cek box (3x3 untuk papan 9x9)
+    start_row, start_col = box * (row // box), box * (col // box)
+    if num in board[start_row:start_row + box, start_col:start_col + box]:
+        return False
+
+    return True
+
+
+def find_solutions(board, limit=2):
+    """Mengembalikan hingga `limit` solusi papan sebagai list np.ndarray."""
+    box = box_size(board)
+    if box != 3:
+        return exact_cover_solutions(board, box, limit=limit)
+    state = _load(board)
+    if state is None:
+        return []
+    solutions = []
+    for grid in _search(*state):
+        solutions.append(np.array(grid, dtype=int).reshape(N, N))
+        if len(solutions) >= limit:
+            break
+    return solutions
+
+
+def count_solutions(board, limit=2, node_limit=None):
+    """Menghitung jumlah solusi papan, berhenti begitu mencapai `limit`.
+
+    Dengan limit=2 cukup untuk memastikan keunikan: hasil 1 berarti solusi
+    tunggal, hasil 2 berarti ada lebih dari satu solusi. Untuk papan besar,
+    `node_limit` membatasi langkah pencarian; jika terlampaui hasilnya None.
+    """
+    box = box_size(board)
+    if box != 3:
+        solutions = exact_cover_solutions(board, box, limit=limit, node_limit=node_limit)
+        return None if solutions is None else len(solutions)
+    state = _load(board)
+    if state is None:
+        return 0
+    count = 0
+    for _ in _search(*state):
+        count += 1
+        if count >= limit:
+            break
+    return count